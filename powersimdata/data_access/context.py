@@ -7,10 +7,13 @@ from powersimdata.utility.config import DeploymentMode, get_deployment_mode
 class Context:
     """Factory for data access instances"""
 
+    _data_access = {}
+
     @staticmethod
     def get_data_access(data_loc=None):
         """Return a data access instance appropriate for the current
-        environment.
+        environment. Instances are shared, so that an ssh connection is reused
+        rather than opened for every caller.
 
         :param str data_loc: pass "disk" if using data from backup disk,
             otherwise leave the default.
@@ -23,9 +26,20 @@ class Context:
             root = server_setup.DATA_ROOT_DIR
 
         mode = get_deployment_mode()
-        if mode == DeploymentMode.Server:
-            return SSHDataAccess(root)
-        return LocalDataAccess(root)
+        key = (mode, root)
+        if key not in Context._data_access:
+            if mode == DeploymentMode.Server:
+                Context._data_access[key] = SSHDataAccess(root)
+            else:
+                Context._data_access[key] = LocalDataAccess(root)
+        return Context._data_access[key]
+
+    @staticmethod
+    def close_all():
+        """Close and discard all the shared data access instances."""
+        for data_access in Context._data_access.values():
+            data_access.close()
+        Context._data_access.clear()
 
     @staticmethod
     def get_launcher(scenario):
@@ -1,4 +1,6 @@
 import functools
+import hashlib
+import io
 import os
 import shutil
 from pathlib import Path
@@ -52,10 +54,67 @@ class CsvStore:
             print("Falling back to local cache...")
 
         if local_path.is_file():
-            return self._parse_csv(local_path)
+            return self._read_local_copy(local_path)
         else:
             raise FileNotFoundError(f"{filename} does not exist locally.")
 
+    def _read_local_copy(self, local_path):
+        """Read the local copy of the file into a data frame. The parsed data frame
+        is pickled next to the csv file, together with the sha1 digest of the csv
+        content, and reused as long as the content is the same. The digest is used
+        rather than the modification time since the csv file is downloaded again
+        every time the table is read.
+
+        :param pathlib.Path local_path: path to the local csv file.
+        :return: (*pandas.DataFrame*) -- the specified file as a data frame.
+        """
+        with open(local_path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha1(content).hexdigest()
+
+        pickle_path = self._pickle_path(local_path)
+        try:
+            cached = pd.read_pickle(pickle_path)
+            if isinstance(cached, tuple) and cached[0] == digest:
+                return cached[1]
+        except Exception:
+            # The copy is missing, corrupted or in an outdated format
+            pass
+
+        table = self._parse_csv(io.BytesIO(content))
+        self._write_pickle(pickle_path, (digest, table))
+        return table
+
+    @staticmethod
+    def _write_pickle(pickle_path, obj):
+        """Pickle an object to a temporary file and move it into place, so that a
+        concurrent reader never sees a partially written file. Nothing is written if
+        the directory is not writable.
+
+        :param pathlib.Path pickle_path: path to the pickle file.
+        :param object obj: object to pickle.
+        """
+        try:
+            tmp_file, tmp_path = mkstemp(dir=pickle_path.parent, suffix=".tmp")
+            os.close(tmp_file)
+            try:
+                pd.to_pickle(obj, tmp_path)
+                os.replace(tmp_path, pickle_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _pickle_path(local_path):
+        """Path of the pickled copy of a local csv file.
+
+        :param pathlib.Path local_path: path to the local csv file.
+        :return: (*pathlib.Path*) -- path to the pickle file.
+        """
+        return local_path.with_name(local_path.name + ".pkl")
+
     def _parse_csv(self, file_object):
         """Read file from disk into data frame
 
@@ -76,7 +135,8 @@ class CsvStore:
         """
         tmp_file, tmp_path = mkstemp(dir=server_setup.LOCAL_DIR)
         table.to_csv(tmp_path)
-        shutil.copy(tmp_path, os.path.join(server_setup.LOCAL_DIR, self._FILE_NAME))
+        local_path = Path(server_setup.LOCAL_DIR, self._FILE_NAME)
+        shutil.copy(tmp_path, local_path)
         os.close(tmp_file)
         tmp_name = os.path.basename(tmp_path)
         self.data_access.push(tmp_name, checksum, change_name_to=self._FILE_NAME)
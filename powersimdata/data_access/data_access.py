@@ -1,9 +1,13 @@
 import glob
+import io
 import operator
 import os
+import pickle
 import posixpath
+import shlex
 import shutil
 import time
+import uuid
 from subprocess import Popen
 from tempfile import mkstemp
 
@@ -14,6 +18,8 @@ from powersimdata.data_access.profile_helper import ProfileHelper
 from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import CommandBuilder
 
+_keepalive_interval = 30  # seconds
+
 _dirs = {
     "tmp": (server_setup.EXECUTE_DIR,),
     "input": server_setup.INPUT_DIR,
@@ -49,6 +55,15 @@ class DataAccess:
         """
         raise NotImplementedError
 
+    def write_pickle(self, obj, file_name, to_dir):
+        """Pickle an object directly into a file on the data store.
+
+        :param object obj: object to pickle.
+        :param str file_name: name of the file to write.
+        :param str to_dir: data store directory to write file to.
+        """
+        raise NotImplementedError
+
     def get_base_dir(self, kind, backup=False):
         """Get path to given kind relative to instance root
 
@@ -222,6 +237,21 @@ class LocalDataAccess(DataAccess):
         self.makedir(os.path.dirname(dest))
         shutil.move(src, dest)
 
+    def write_pickle(self, obj, file_name, to_dir):
+        """Pickle an object directly into a file on the data store.
+
+        :param object obj: object to pickle.
+        :param str file_name: name of the file to write.
+        :param str to_dir: data store directory to write file to.
+        """
+        self._check_filename(file_name)
+        dest = self.join(self.root, to_dir, file_name)
+        print(f"--> Writing {dest}")
+        self._check_file_exists(dest, should_exist=False)
+        self.makedir(os.path.dirname(dest))
+        with open(dest, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
     def makedir(self, full_path):
         """Create path on local machine
 
@@ -273,11 +303,11 @@ class LocalDataAccess(DataAccess):
 
         :param str grid_model: grid model.
         :param str kind: *'demand'*, *'hydro'*, *'solar'* or *'wind'*.
-        :return: (*list*) -- available profile version.
+        :return: (*list*) -- available profile version, blob storage versions first.
         """
         blob_version = super().get_profile_version(grid_model, kind)
         local_version = ProfileHelper.get_profile_version_local(grid_model, kind)
-        return list(set(blob_version + local_version))
+        return list(dict.fromkeys(blob_version + local_version))
 
     def _exists(self, filepath):
         """Return whether the file exists
@@ -304,11 +334,18 @@ class SSHDataAccess(DataAccess):
 
     @property
     def ssh(self):
-        """Get or create the ssh connection object, with attempts rate limited.
+        """Get or create the ssh connection object, with attempts rate limited. The
+        connection is kept open and reused by every command, and is re-established
+        if the server dropped it.
 
         :raises IOError: if connection failed or still within retry window
         :return: (*paramiko.SSHClient*) -- the client instance
         """
+        if self._ssh is not None:
+            transport = self._ssh.get_transport()
+            if transport is None or not transport.is_active():
+                self.close()
+
         should_attempt = time.time() - SSHDataAccess._last_attempt > self._retry_after
 
         if self._ssh is None:
@@ -347,9 +384,26 @@ class SSHDataAccess(DataAccess):
             port=server_setup.SERVER_SSH_PORT,
             timeout=10,
         )
+        # Keep idle connections open, so that they can be reused between commands
+        client.get_transport().set_keepalive(_keepalive_interval)
 
         self._ssh = client
 
+    def _run(self, command):
+        """Run a command on the server and wait for it to complete. Success is given
+        by the exit status, so that warnings printed on stderr are not mistaken for
+        errors, and stderr is only read if the command failed.
+
+        :param str command: command to run.
+        :return: (*tuple*) -- lines printed on stdout, lines printed on stderr and
+            exit status.
+        """
+        _, stdout, stderr = self.ssh.exec_command(command)
+        out = stdout.readlines()
+        status = stdout.channel.recv_exit_status()
+        errors = stderr.readlines() if status != 0 else []
+        return out, errors, status
+
     def copy_from(self, file_name, from_dir=None):
         """Copy a file from data store to userspace.
 
@@ -382,6 +436,8 @@ class SSHDataAccess(DataAccess):
         :param str to_dir: data store directory to copy file to.
         :param str change_name_to: new name for file when copied to data store.
         :raises FileNotFoundError: if specified file does not exist
+        :raises IOError: if the destination directory cannot be created
+        :raises OSError: if a file already exists at the destination
         """
         self._check_filename(file_name)
         from_path = os.path.join(self.local_root, file_name)
@@ -392,10 +448,7 @@ class SSHDataAccess(DataAccess):
             )
 
         file_name = file_name if change_name_to is None else change_name_to
-        to_dir = self.join(self.root, "" if to_dir is None else to_dir)
-        to_path = self.join(to_dir, file_name)
-        self.makedir(to_dir)
-        self._check_file_exists(to_path, should_exist=False)
+        to_path = self._prepare_destination(file_name, to_dir)
 
         with self.ssh.open_sftp() as sftp:
             print(f"Transferring {file_name} to server")
@@ -403,6 +456,47 @@ class SSHDataAccess(DataAccess):
 
         os.remove(from_path)
 
+    def write_pickle(self, obj, file_name, to_dir=None):
+        """Pickle an object directly into a file on the data store.
+
+        :param object obj: object to pickle.
+        :param str file_name: name of the file to write.
+        :param str to_dir: data store directory to write file to.
+        :raises IOError: if the destination directory cannot be created
+        :raises OSError: if a file already exists at the destination
+        """
+        self._check_filename(file_name)
+        to_path = self._prepare_destination(file_name, to_dir)
+
+        buffer = io.BytesIO()
+        pickle.dump(obj, buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        buffer.seek(0)
+        with self.ssh.open_sftp() as sftp:
+            print(f"Writing {file_name} to server")
+            sftp.putfo(buffer, to_path)
+
+    def _prepare_destination(self, file_name, to_dir):
+        """Create the destination directory and check that the file is new.
+
+        :param str file_name: name of the file to be written.
+        :param str to_dir: data store directory, relative to root.
+        :return: (*str*) -- full path of the file on the server.
+        :raises IOError: if the destination directory cannot be created
+        :raises OSError: if a file already exists at the destination
+        """
+        to_dir = self.join(self.root, "" if to_dir is None else to_dir)
+        to_path = self.join(to_dir, file_name)
+        # Create the directory and check the destination in a single round trip
+        out, _, status = self._run(
+            f"mkdir -p {shlex.quote(to_dir)} && "
+            f"if [ -e {shlex.quote(to_path)} ]; then echo exists; fi"
+        )
+        if status != 0:
+            raise IOError(f"Failed to create {to_dir} on server")
+        if len(out) != 0:
+            raise OSError(f"{to_path} already exists on {self.description}")
+        return to_path
+
     def execute_command_async(self, command):
         """Execute a command via ssh, without waiting for completion.
 
@@ -420,14 +514,14 @@ class SSHDataAccess(DataAccess):
 
         :param str relative_path: path relative to root
         :return: (*str*) -- the checksum of the file
+        :raises OSError: if the file does not exist
         """
         full_path = self.join(self.root, relative_path)
-        self._check_file_exists(full_path)
 
-        command = f"sha1sum {full_path}"
-        _, stdout, _ = self.ssh.exec_command(command)
-        lines = stdout.readlines()
-        return lines[0].strip()
+        out, _, status = self._run(f"sha1sum {shlex.quote(full_path)}")
+        if status != 0:
+            raise OSError(f"{full_path} not found on {self.description}")
+        return out[0].strip()
 
     def push(self, file_name, checksum, change_name_to=None):
         """Push file to server and verify the checksum matches a prior value
@@ -435,31 +529,36 @@ class SSHDataAccess(DataAccess):
         :param str file_name: the file name, located at the local root
         :param str checksum: the checksum prior to download
         :param str change_name_to: new name for file when copied to data store.
-        :raises IOError: if command generated stderr
+        :raises IOError: if the file on the server changed since it was downloaded
         """
+        self._check_filename(file_name)
+        from_path = os.path.join(self.local_root, file_name)
         new_name = file_name if change_name_to is None else change_name_to
-        backup = f"{new_name}.temp"
-        self.move_to(file_name, change_name_to=backup)
+        # A unique name cannot clash with another upload, so the file is sent
+        # without first checking the destination in a separate round trip
+        backup = f"{new_name}.{uuid.uuid4().hex}.temp"
+        with self.ssh.open_sftp() as sftp:
+            print(f"Transferring {file_name} to server")
+            sftp.put(from_path, self.join(self.root, backup))
+        os.remove(from_path)
 
         values = {
-            "original": self.join(self.root, new_name),
-            "updated": self.join(self.root, backup),
-            "lockfile": self.join(self.root, "scenario.lockfile"),
-            "checksum": checksum,
+            "original": shlex.quote(self.join(self.root, new_name)),
+            "updated": shlex.quote(self.join(self.root, backup)),
+            "lockfile": shlex.quote(self.join(self.root, "scenario.lockfile")),
+            "checksum": shlex.quote(checksum),
         }
 
         template = "(flock -x 200; \
-                prev='{checksum}'; \
+                prev={checksum}; \
                 curr=$(sha1sum {original}); \
                 if [[ $prev == $curr ]]; then mv {updated} {original} -b; \
-                else echo CONFLICT_ERROR 1>&2; fi) \
+                else rm -f {updated}; echo CONFLICT_ERROR 1>&2; exit 1; fi) \
                 200>{lockfile}"
 
         command = template.format(**values)
-        _, _, stderr = self.ssh.exec_command(command)
-
-        errors = stderr.readlines()
-        if len(errors) > 0:
+        _, errors, status = self._run(command)
+        if status != 0:
             for e in errors:
                 print(e)
             raise IOError("Failed to push file - most likely a conflict was detected.")
@@ -468,26 +567,27 @@ class SSHDataAccess(DataAccess):
         """Create path on server
 
         :param str full_path: the path, excluding filename
-        :raises IOError: if command generated stderr
+        :raises IOError: if command failed
         """
-        _, _, stderr = self.ssh.exec_command(f"mkdir -p {full_path}")
-        errors = stderr.readlines()
-        if len(errors) > 0:
+        _, _, status = self._run(f"mkdir -p {shlex.quote(full_path)}")
+        if status != 0:
             raise IOError(f"Failed to create {full_path} on server")
 
     def copy(self, src, dest, recursive=False, update=False):
         """Wrapper around cp command which creates dest path if needed
 
-        :param str src: path to original
+        :param str src: path to original, may contain wildcards
         :param str dest: destination path
         :param bool recursive: create directories recursively
         :param bool update: only copy if needed
-        :raises IOError: if command generated stderr
+        :raises IOError: if command failed
         """
-        self.makedir(dest)
-        command = CommandBuilder.copy(src, dest, recursive, update)
-        _, _, stderr = self.ssh.exec_command(command)
-        if len(stderr.readlines()) != 0:
+        dest = shlex.quote(dest)
+        command = (
+            f"mkdir -p {dest} && {CommandBuilder.copy(src, dest, recursive, update)}"
+        )
+        _, _, status = self._run(command)
+        if status != 0:
             raise IOError(f"Failed to execute {command}")
 
     def remove(self, target, recursive=False, confirm=True):
@@ -496,7 +596,7 @@ class SSHDataAccess(DataAccess):
         :param str target: path to remove
         :param bool recursive: delete directories recursively
         :param bool confirm: prompt before executing command
-        :raises IOError: if command generated stderr
+        :raises IOError: if command failed
         """
         command = CommandBuilder.remove(target, recursive)
         if confirm:
@@ -504,8 +604,8 @@ class SSHDataAccess(DataAccess):
             if confirmed.lower() != "y":
                 print("Operation cancelled.")
                 return
-        _, _, stderr = self.ssh.exec_command(command)
-        if len(stderr.readlines()) != 0:
+        _, _, status = self._run(command)
+        if status != 0:
             raise IOError(f"Failed to delete target={target} on server")
         print("--> Done!")
 
@@ -515,13 +615,16 @@ class SSHDataAccess(DataAccess):
         :param str filepath: the path to the file
         :return: (*bool*) -- whether the file exists
         """
-        _, _, stderr = self.ssh.exec_command(f"ls {filepath}")
-        return len(stderr.readlines()) == 0
+        _, _, status = self._run(f"ls {shlex.quote(filepath)}")
+        return status == 0
 
     def close(self):
-        """Close the connection if one is open"""
+        """Close the connection if one is open. A new connection is established if
+        the instance is used again.
+        """
         if self._ssh is not None:
             self._ssh.close()
+            self._ssh = None
 
 
 def progress_bar(*args, **kwargs):
@@ -71,12 +71,9 @@ class ScenarioListManager(CsvStore):
         """
         table = self.get_scenario_table()
         scenario_id = self._generate_scenario_id(table)
+        table.loc[int(scenario_id)] = pd.Series(scenario_info)
         scenario_info["id"] = scenario_id
         scenario_info.move_to_end("id", last=False)
-        table.reset_index(inplace=True)
-        entry = pd.DataFrame({k: [v] for k, v in scenario_info.items()})
-        table = table.append(entry)
-        table.set_index("id", inplace=True)
 
         print("--> Adding entry in %s" % self._FILE_NAME)
         return table
@@ -0,0 +1,13 @@
+from powersimdata.data_access.context import Context
+
+
+def test_get_data_access_is_shared():
+    data_access = Context.get_data_access()
+    assert Context.get_data_access() is data_access
+    assert Context.get_data_access("disk") is not data_access
+
+
+def test_close_all():
+    data_access = Context.get_data_access()
+    Context.close_all()
+    assert Context.get_data_access() is not data_access
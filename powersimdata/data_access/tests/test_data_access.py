@@ -1,4 +1,5 @@
 import os
+import pickle
 import sys
 import tempfile
 from pathlib import Path
@@ -149,6 +150,77 @@ def test_move_to_rename(mock_data_access, make_temp):
     _check_content(os.path.join(mock_data_access.root, new_fname))
 
 
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_move_to_existing_file(mock_data_access, make_temp):
+    fname = make_temp(remote=False)
+    remote_fname = make_temp()
+    with pytest.raises(OSError, match="already exists"):
+        mock_data_access.move_to(fname, change_name_to=remote_fname)
+
+
+def test_write_pickle(mock_data_access):
+    mock_data_access.write_pickle({"a": 1}, "obj.pkl", "foo")
+    with open(os.path.join(mock_data_access.root, "foo", "obj.pkl"), "rb") as f:
+        assert pickle.load(f) == {"a": 1}
+    with pytest.raises(OSError, match="already exists"):
+        mock_data_access.write_pickle({"a": 2}, "obj.pkl", "foo")
+
+
+def test_paths_are_quoted(mock_data_access):
+    mock_data_access.write_pickle({"a": 1}, "obj.pkl", "foo bar")
+    path = os.path.join(mock_data_access.root, "foo bar", "obj.pkl")
+    assert os.path.isfile(path)
+    assert mock_data_access._exists(path)
+    assert not mock_data_access._exists(os.path.join(mock_data_access.root, "foo"))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_checksum(mock_data_access, make_temp):
+    fname = make_temp()
+    assert mock_data_access.checksum(fname).startswith(
+        "040f06fd774092478d450774f5ba30c5da78acc8"
+    )
+    with pytest.raises(OSError, match="not found"):
+        mock_data_access.checksum("missing_file")
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_copy(mock_data_access, make_temp):
+    fname = make_temp()
+    src = os.path.join(mock_data_access.root, fname)
+    dest = os.path.join(mock_data_access.root, "foo", "bar")
+    mock_data_access.copy(src, dest)
+    _check_content(os.path.join(dest, fname))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_exists(mock_data_access, make_temp):
+    fname = make_temp()
+    assert mock_data_access._exists(os.path.join(mock_data_access.root, fname))
+    assert not mock_data_access._exists(
+        os.path.join(mock_data_access.root, "missing_file")
+    )
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_push(mock_data_access, make_temp):
+    remote_fname = make_temp()
+    checksum = mock_data_access.checksum(remote_fname)
+    fname = make_temp(remote=False)
+    mock_data_access.push(fname, checksum, change_name_to=remote_fname)
+    _check_content(os.path.join(mock_data_access.root, remote_fname))
+    assert not os.path.exists(os.path.join(mock_data_access.local_root, fname))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_push_conflict(mock_data_access, make_temp):
+    remote_fname = make_temp()
+    fname = make_temp(remote=False)
+    with pytest.raises(IOError, match="conflict"):
+        mock_data_access.push(fname, "stale", change_name_to=remote_fname)
+    assert not any(f.endswith(".temp") for f in os.listdir(mock_data_access.root))
+
+
 def test_check_filename(mock_data_access):
     with pytest.raises(ValueError):
         mock_data_access.copy_from("dir/foo.txt", "dir")
@@ -63,6 +63,8 @@ def manager():
     manager._FILE_NAME = "ExecuteList.csv.test"
     yield manager
     os.remove(test_csv)
+    if os.path.exists(test_csv + ".pkl"):
+        os.remove(test_csv + ".pkl")
 
 
 def mock_row():
@@ -113,3 +115,29 @@ def test_delete(manager):
 
     table = manager.get_execute_table()
     assert table.shape == (0, 1)
+
+
+def test_parsed_table_is_pickled(manager):
+    manager.add_entry(mock_row())
+    table = manager.get_execute_table()
+    pickle_path = os.path.join(server_setup.LOCAL_DIR, "ExecuteList.csv.test.pkl")
+    assert os.path.isfile(pickle_path)
+    assert_frame_equal(manager.get_execute_table(), table)
+
+
+def test_pickled_table_is_reused_after_download(manager, monkeypatch):
+    manager.add_entry(mock_row())
+    table = manager.get_execute_table()
+
+    # A download rewrites the csv with a new modification time
+    csv_path = os.path.join(server_setup.LOCAL_DIR, "ExecuteList.csv.test")
+    with open(csv_path, "rb") as f:
+        content = f.read()
+    with open(csv_path, "wb") as f:
+        f.write(content)
+
+    def fail(*args):
+        raise AssertionError("csv should not be parsed again")
+
+    monkeypatch.setattr(manager, "_parse_csv", fail)
+    assert_frame_equal(manager.get_execute_table(), table)
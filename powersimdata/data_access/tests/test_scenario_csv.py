@@ -80,6 +80,8 @@ def manager():
     manager._FILE_NAME = "ScenarioList.csv.test"
     yield manager
     os.remove(test_csv)
+    if os.path.exists(test_csv + ".pkl"):
+        os.remove(test_csv + ".pkl")
 
 
 def mock_row():
@@ -1,4 +1,5 @@
-import copy
+import functools
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -7,6 +8,12 @@ from powersimdata.input.grid import Grid
 from powersimdata.network.model import area_to_loadzone
 from powersimdata.utility.helpers import _check_import
 
+# Supply data already computed, keyed by (id of Grid object, number of segments)
+_supply_data_cache = {}
+
+# Load zones only depend on the grid model, area and area type
+_area_to_loadzone = functools.lru_cache(maxsize=None)(area_to_loadzone)
+
 
 def linearize_gencost(input_grid, num_segments=1):
     """Updates the generator cost information to include piecewise linear cost curve
@@ -21,25 +28,24 @@ def linearize_gencost(input_grid, num_segments=1):
     :raises ValueError: if the generator cost curve is not of an acceptable form.
     """
 
-    # Access the generator cost and plant information components
-    grid = copy.deepcopy(input_grid)
-    gencost_before = grid.gencost["before"]
-    plant = grid.plant
+    # Access the generator cost and plant information components (read only)
+    gencost_before = input_grid.gencost["before"]
+    plant = input_grid.plant
 
     # Raise errors if the provided cost curves are not in a form that can be handled
-    if len(gencost_before[gencost_before.type != 2]):
+    if (gencost_before.type != 2).any():
         raise ValueError("gencost currently limited to polynomial")
-    if len(gencost_before[gencost_before.n != 3]):
+    if (gencost_before.n != 3).any():
         raise ValueError("gencost currently limited to quadratic")
 
     # Access the quadratic cost curve information
-    quad_term = gencost_before.c2
-    lin_term = gencost_before.c1
-    const_term = gencost_before.c0
+    quad_term = gencost_before.c2.to_numpy()
+    lin_term = gencost_before.c1.to_numpy()
+    const_term = gencost_before.c0.to_numpy()
 
     # Convert dispatchable generators to piecewise segments
     dispatchable_gens = plant.Pmin != plant.Pmax
-    if sum(dispatchable_gens) > 0:
+    if dispatchable_gens.any():
         gencost_after = pd.DataFrame(
             index=gencost_before.index,
             columns=["type", "startup", "shutdown", "n", "c2", "c1", "c0"],
@@ -49,36 +55,38 @@ def linearize_gencost(input_grid, num_segments=1):
             ["startup", "shutdown", "c2", "c1", "c0"]
         ]
         gencost_after.loc[dispatchable_gens, "n"] = num_segments + 1
-        power_step = (plant.Pmax - plant.Pmin) / num_segments
+        pmin = plant.Pmin.to_numpy()
+        power_step = (plant.Pmax.to_numpy() - pmin) / num_segments
+        dispatchable = dispatchable_gens.to_numpy()
         for i in range(num_segments + 1):
             capacity_label = "p" + str(i + 1)
             price_label = "f" + str(i + 1)
-            capacity_data = plant.Pmin + power_step * i
-            price_data = (
-                quad_term * capacity_data ** 2 + lin_term * capacity_data + const_term
-            )
+            capacity_data = pmin + power_step * i
+            # Evaluate the quadratic cost curve using Horner's method
+            price_data = (quad_term * capacity_data + lin_term) * capacity_data
+            price_data += const_term
             gencost_after.loc[dispatchable_gens, capacity_label] = capacity_data[
-                dispatchable_gens
-            ]
-            gencost_after.loc[dispatchable_gens, price_label] = price_data[
-                dispatchable_gens
+                dispatchable
             ]
+            gencost_after.loc[dispatchable_gens, price_label] = price_data[dispatchable]
     else:
-        grid.gencost["after"] = gencost_before.copy()
+        gencost_after = gencost_before.copy()
 
     # Convert non-dispatchable gens to fixed values
     nondispatchable_gens = ~dispatchable_gens
-    if sum(nondispatchable_gens) > 0:
+    if nondispatchable_gens.any():
         gencost_after.loc[nondispatchable_gens, "type"] = gencost_before.loc[
             nondispatchable_gens, "type"
         ]
         gencost_after.loc[nondispatchable_gens, "n"] = gencost_before.loc[
             nondispatchable_gens, "n"
         ]
-        power = plant.Pmax
-        price_data = quad_term * power ** 2 + lin_term * power + const_term
+        power = plant.Pmax.to_numpy()
+        price_data = (quad_term * power + lin_term) * power + const_term
         gencost_after.loc[nondispatchable_gens, ["c2", "c1"]] = 0
-        gencost_after.loc[nondispatchable_gens, "c0"] = price_data[nondispatchable_gens]
+        gencost_after.loc[nondispatchable_gens, "c0"] = price_data[
+            nondispatchable_gens.to_numpy()
+        ]
 
     gencost_after["interconnect"] = gencost_before["interconnect"]
 
@@ -93,58 +101,121 @@ def get_supply_data(grid, num_segments=1, save=None):
     :param powersimdata.input.grid.Grid grid: Grid object.
     :param int num_segments: The number of segments into which the piecewise linear
         cost curve will be split.
-    :param str save: Saves a .csv if a str representing a valid file path and file
-        name is provided. If None, nothing is saved.
+    :param str save: Saves the supply data if a str representing a valid file path
+        and file name is provided. The data is saved as a .parquet file if the file
+        name has a .parquet extension (requires pyarrow), as a .csv file otherwise.
+        If None, nothing is saved.
     :return: (*pandas.DataFrame*) -- Supply information needed to analyze cost and
         supply curves.
     :raises TypeError: if a powersimdata.input.grid.Grid object is not input, or
         if the save parameter is not input as a str.
+
+    .. note:: the supply data is computed once per Grid object and number of
+        segments. Subsequent calls return a shallow copy of the cached DataFrame, so
+        the Grid object should not be modified in between calls.
     """
 
     # Check that a Grid object is input
     if not isinstance(grid, Grid):
         raise TypeError("A Grid object must be input.")
 
-    # Obtain a copy of the Grid object
-    grid = copy.deepcopy(grid)
+    # Return the supply data if it has already been computed for this Grid object
+    key = (id(grid), num_segments)
+    if save is None and key in _supply_data_cache:
+        return _supply_data_cache[key].copy(deep=False)
+
+    # Drop the cached supply data once the Grid object is garbage collected
+    if key not in _supply_data_cache:
+        weakref.finalize(grid, _supply_data_cache.pop, key, None)
 
     # Access the generator cost and plant information data
     gencost_df = linearize_gencost(grid, num_segments)
     plant_df = grid.plant
 
-    # Create a new DataFrame with the desired columns
-    supply_df = pd.concat(
-        [
-            plant_df[["type", "interconnect", "zone_name"]],
-            gencost_df[
-                gencost_df.columns.difference(
-                    ["type", "startup", "shutdown", "n", "interconnect"], sort=False
-                )
-            ],
-        ],
-        axis=1,
-    )
+    # Gather the desired columns, then build the DataFrame in a single allocation
+    columns = {
+        c: pd.Categorical(plant_df[c].to_numpy())
+        for c in ["type", "interconnect", "zone_name"]
+    }
+    for c in gencost_df.columns.difference(
+        ["type", "startup", "shutdown", "n", "interconnect"], sort=False
+    ):
+        columns[c] = gencost_df[c].to_numpy()
 
     # Add p_diff and slope according to the number of cost curve segments
     for i in range(num_segments):
-        supply_df["p_diff" + str(i + 1)] = (
-            supply_df["p" + str(i + 2)] - supply_df["p" + str(i + 1)]
+        p_diff = columns["p" + str(i + 2)] - columns["p" + str(i + 1)]
+        f_diff = columns["f" + str(i + 2)] - columns["f" + str(i + 1)]
+        columns["p_diff" + str(i + 1)] = p_diff
+        # Generators with no capacity (Pmin = Pmax) have no slope
+        columns["slope" + str(i + 1)] = np.divide(
+            f_diff, p_diff, out=np.full_like(p_diff, np.nan), where=p_diff != 0
         )
-        supply_df["slope" + str(i + 1)] = (
-            supply_df["f" + str(i + 2)] - supply_df["f" + str(i + 1)]
-        ) / supply_df["p_diff" + str(i + 1)]
+    supply_df = pd.DataFrame(columns, index=plant_df.index)
 
-    # Save the supply data to a .csv file if desired
+    # Save the supply data to a .parquet or .csv file if desired
     if save is not None:
         if not isinstance(save, str):
             raise TypeError("The file path and file name must be input as a str.")
+        elif save.endswith(".parquet"):
+            _check_import("pyarrow")
+            supply_df.to_parquet(save, compression="zstd")
         else:
             supply_df.to_csv(save)
 
+    # Index the rows of each (generation type, load zone) pair for fast trimming
+    _index_supply_data(supply_df)
+
     # Return the necessary supply information
+    _supply_data_cache[key] = supply_df
+    return supply_df.copy(deep=False)
+
+
+def load_supply_data(path):
+    """Loads supply data previously saved by :func:`get_supply_data`.
+
+    :param str path: path to a .parquet or .csv file.
+    :return: (*pandas.DataFrame*) -- Supply information needed to analyze cost and
+        supply curves.
+    :raises TypeError: if path is not a str.
+    """
+    if not isinstance(path, str):
+        raise TypeError("The file path and file name must be input as a str.")
+
+    if path.endswith(".parquet"):
+        _check_import("pyarrow")
+        supply_df = pd.read_parquet(path)
+    else:
+        supply_df = pd.read_csv(
+            path,
+            index_col=0,
+            dtype={
+                "type": "category",
+                "interconnect": "category",
+                "zone_name": "category",
+            },
+        )
+    _index_supply_data(supply_df)
+
     return supply_df
 
 
+def _index_supply_data(supply_df):
+    """Stores the generation types and the row positions of each (generation type,
+    load zone) pair in the attributes of the supply data. Generators that have no
+    capacity are left out of the row positions.
+
+    :param pandas.DataFrame supply_df: DataFrame containing the supply curve
+        information.
+    """
+    supply_df.attrs["types"] = frozenset(supply_df["type"].unique())
+    position = np.flatnonzero(supply_df["slope1"].notna().to_numpy())
+    by_type_zone = (
+        supply_df.iloc[position].groupby(["type", "zone_name"], observed=True).indices
+    )
+    supply_df.attrs["by_type_zone"] = {k: position[v] for k, v in by_type_zone.items()}
+
+
 def check_supply_data(supply_data, num_segments=1):
     """Checks to make sure that the input supply data is a DataFrame and has the
     correct columns. This is especially needed for checking instances where the input
@@ -186,8 +257,27 @@ def check_supply_data(supply_data, num_segments=1):
         raise ValueError(f'Missing columns: {", ".join(miss_cols)}')
 
 
-def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=True):
-    """Builds a supply curve for a specified area and generation type.
+def _select_supply_data(supply_data, zones, gen_type):
+    """Selects the generators of a given type located in a set of load zones, using
+    the row positions stored by :func:`get_supply_data`.
+
+    :param pandas.DataFrame supply_data: DataFrame containing the supply curve
+        information.
+    :param iterable zones: load zone names.
+    :param str gen_type: Generation type.
+    :return: (*pandas.DataFrame*) -- rows of supply_data matching the selection.
+    """
+    by_type_zone = supply_data.attrs["by_type_zone"]
+    index = [
+        by_type_zone[(gen_type, z)] for z in zones if (gen_type, z) in by_type_zone
+    ]
+    index = np.sort(np.concatenate(index)) if index else np.array([], dtype=int)
+    return supply_data.iloc[index]
+
+
+def _get_segment_data(grid, num_segments, area, gen_type, area_type=None):
+    """Gathers the capacity and price of every cost curve segment of the generators
+    of a given type located in a specified area.
 
     :param powersimdata.input.grid.Grid grid: Grid object.
     :param int num_segments: The number of segments into which the piecewise linear
@@ -198,11 +288,8 @@ def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=
     :param str area_type: one of: *'loadzone'*, *'state'*, *'state_abbr'*,
         *'interconnect'*. Defaults to None, which allows
         :func:`powersimdata.network.model.area_to_loadzone` to infer the type.
-    :param bool plot: If True, the supply curve plot is shown. If False, the plot is
-        not shown.
-    :return: (*tuple*) -- First element is a list of capacity (MW) amounts needed
-        to create supply curve. Second element is a list of bids ($/MW) in the supply
-        curve.
+    :return: (*pandas.DataFrame*) -- capacity (*'p_diff'*) and price (*'slope'*) of
+        each segment. Empty if the area contains no generators of the specified type.
     :raises TypeError: if a powersimdata.input.grid.Grid object is not input.
     :raises ValueError: if the specified area or generator type is not applicable.
     """
@@ -224,23 +311,20 @@ def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=
     check_supply_data(supply_data, num_segments)
 
     # Check to make sure the generator type is valid
-    if gen_type not in supply_data["type"].unique():
+    if gen_type not in supply_data.attrs["types"]:
         raise ValueError(f"{gen_type} is not a valid generation type.")
 
     # Identify the load zones that correspond to the specified area and area_type
-    returned_zones = area_to_loadzone(grid.grid_model, area, area_type)
-
-    # Trim the DataFrame to only be of the desired area and generation type
-    supply_data = supply_data.loc[supply_data.zone_name.isin(returned_zones)]
-    supply_data = supply_data.loc[supply_data["type"] == gen_type]
+    returned_zones = _area_to_loadzone(grid.grid_model, area, area_type)
 
-    # Remove generators that have no capacity (e.g., Maine coal generators)
-    if supply_data["slope1"].isnull().values.any():
-        supply_data.dropna(subset=["slope1"], inplace=True)
+    # Trim the DataFrame to only be of the desired area and generation type. The
+    # index built by get_supply_data already leaves out generators that have no
+    # capacity (e.g., Maine coal generators)
+    supply_data = _select_supply_data(supply_data, returned_zones, gen_type)
 
     # Check if the area contains generators of the specified type
     if supply_data.empty:
-        return [], []
+        return pd.DataFrame(columns=["p_diff", "slope"])
 
     # Combine the p_diff and slope information for each cost segment
     supply_df_cols = []
@@ -253,43 +337,99 @@ def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=
             inplace=True,
         )
     supply_df = pd.concat(supply_df_cols, axis=0)
+    return supply_df.reset_index(drop=True)
+
+
+def build_supply_curve(
+    grid, num_segments, area, gen_type, area_type=None, plot=True, show=True
+):
+    """Builds a supply curve for a specified area and generation type.
+
+    :param powersimdata.input.grid.Grid grid: Grid object.
+    :param int num_segments: The number of segments into which the piecewise linear
+        cost curve is split.
+    :param str area: Either the load zone, state name, state abbreviation, or
+        interconnect.
+    :param str gen_type: Generation type.
+    :param str area_type: one of: *'loadzone'*, *'state'*, *'state_abbr'*,
+        *'interconnect'*. Defaults to None, which allows
+        :func:`powersimdata.network.model.area_to_loadzone` to infer the type.
+    :param bool plot: If True, the supply curve is plotted. If False, the plot is
+        not created.
+    :param bool show: If True, the plot is shown. If False, the figure is left open
+        and can be retrieved with :func:`matplotlib.pyplot.gcf`.
+    :return: (*tuple*) -- First element is a list of capacity (MW) amounts needed
+        to create supply curve. Second element is a list of bids ($/MW) in the supply
+        curve.
+    :raises TypeError: if a powersimdata.input.grid.Grid object is not input.
+    :raises ValueError: if the specified area or generator type is not applicable.
+    """
+
+    # Obtain the p_diff and slope of each cost segment in the area
+    supply_df = _get_segment_data(grid, num_segments, area, gen_type, area_type)
 
-    # Sort the trimmed DataFrame by slope
-    supply_df = supply_df.sort_values(by="slope")
-    supply_df = supply_df.reset_index(drop=True)
-
-    # Determine the points that comprise the supply curve
-    capacity_data = []
-    price_data = []
-    capacity_diff_sum = 0
-    for i in supply_df.index:
-        capacity_data.append(capacity_diff_sum)
-        price_data.append(supply_df["slope"][i])
-        capacity_data.append(supply_df["p_diff"][i] + capacity_diff_sum)
-        price_data.append(supply_df["slope"][i])
-        capacity_diff_sum += supply_df["p_diff"][i]
+    # Check if the area contains generators of the specified type
+    if supply_df.empty:
+        return [], []
+
+    # Sort the segments by slope
+    slope = supply_df["slope"].to_numpy(float)
+    order = np.argsort(slope, kind="stable")
+    slope = slope[order]
+    p_diff = supply_df["p_diff"].to_numpy(float)[order]
+
+    # Determine the points that comprise the supply curve: each segment contributes
+    # its starting and ending cumulative capacity, both at the segment's price
+    capacity_cumsum = np.zeros(len(p_diff) + 1)
+    np.cumsum(p_diff, out=capacity_cumsum[1:])
+    capacity_data = np.repeat(capacity_cumsum, 2)[1:-1].tolist()
+    price_data = np.repeat(slope, 2).tolist()
 
     # Plot the curve
     if plot:
-        plt = _check_import("matplotlib.pyplot")
-        plt.figure(figsize=[20, 10])
-        plt.plot(capacity_data, price_data)
-        plt.title(f"Supply curve for {gen_type} generators in {area}", fontsize=20)
-        plt.xlabel("Capacity (MW)", fontsize=20)
-        plt.ylabel("Price ($/MW)", fontsize=20)
-        plt.xticks(fontsize=20)
-        plt.yticks(fontsize=20)
-        plt.show()
+        _plot_supply_curves(
+            [(capacity_data, price_data)],
+            f"Supply curve for {gen_type} generators in {area}",
+        )
+        _show_plot(show)
 
     # Return the capacity and bid amounts
     return capacity_data, price_data
 
 
+def _plot_supply_curves(curves, title):
+    """Plots one or several supply curves on a single figure.
+
+    :param list curves: list of (capacity, price) pairs, one per supply curve.
+    :param str title: title of the plot.
+    :return: (*matplotlib.figure.Figure*) -- the figure.
+    """
+    plt = _check_import("matplotlib.pyplot")
+    fig, ax = plt.subplots(figsize=[20, 10])
+    for capacity_data, price_data in curves:
+        ax.plot(capacity_data, price_data)
+    ax.set_title(title, fontsize=20)
+    ax.set_xlabel("Capacity (MW)", fontsize=20)
+    ax.set_ylabel("Price ($/MW)", fontsize=20)
+    ax.tick_params(labelsize=20)
+    return fig
+
+
+def _show_plot(show):
+    """Shows the current figures if requested.
+
+    :param bool show: whether to show the figures.
+    """
+    if show:
+        plt = _check_import("matplotlib.pyplot")
+        plt.show()
+
+
 def lower_bound_index(desired_capacity, capacity_data):
     """Determines the index of the lower capacity value that defines a price segment.
     Useful for accessing the prices associated with capacity values that aren't
     explicitly stated in the capacity lists that are generated by the
-    build_supply_curve() function. Needed for ks_test().
+    build_supply_curve() function.
 
     :param float/int desired_capacity: Capacity value for which you want to determine
         the index of the lowest capacity value in a price segment.
@@ -307,6 +447,32 @@ def lower_bound_index(desired_capacity, capacity_data):
             return i - 1
 
 
+def _ks_core(capacity_data1, price_data1, capacity_data2, price_data2):
+    """Computes the maximum price difference between two supply curves.
+
+    :param numpy.ndarray capacity_data1: sorted capacity values for the first supply
+        curve.
+    :param numpy.ndarray price_data1: price values for the first supply curve.
+    :param numpy.ndarray capacity_data2: sorted capacity values for the second supply
+        curve.
+    :param numpy.ndarray price_data2: price values for the second supply curve.
+    :return: (*float*) -- The maximum price difference between the two supply curves.
+    """
+    # Create an array that has every capacity value in which either supply curve
+    # steps up, sorted and without duplicates
+    capacity_data_all = np.union1d(capacity_data1, capacity_data2)
+
+    # For each capacity value, find the index of the lower capacity value that defines
+    # the corresponding price segment in each supply curve. Capacity lists are sorted,
+    # so a binary search replaces a linear scan per capacity value.
+    index1 = np.searchsorted(capacity_data1, capacity_data_all, side="right") - 1
+    index2 = np.searchsorted(capacity_data2, capacity_data_all, side="right") - 1
+    price_data_all1 = price_data1[index1.clip(0, len(price_data1) - 1)]
+    price_data_all2 = price_data2[index2.clip(0, len(price_data2) - 1)]
+
+    return np.abs(price_data_all1 - price_data_all2).max()
+
+
 def ks_test(
     capacity_data1,
     price_data1,
@@ -315,88 +481,66 @@ def ks_test(
     area=None,
     gen_type=None,
     plot=True,
+    show=True,
 ):
     """Runs a test that is similar to the Kolmogorov-Smirnov test. This function takes
     two supply curves as inputs and returns the greatest difference in price between
     the two supply curves. This function requires that the supply curves offer the same
     amount of capacity.
 
-    :param list capacity_data1: List of capacity values for the first supply curve.
-    :param list price_data1: List of price values for the first supply curve.
-    :param list capacity_data2: List of capacity values for the second supply curve.
-    :param list price_data2: List of price values for the second supply curve.
+    :param list/numpy.ndarray capacity_data1: capacity values for the first supply
+        curve.
+    :param list/numpy.ndarray price_data1: price values for the first supply curve.
+    :param list/numpy.ndarray capacity_data2: capacity values for the second supply
+        curve.
+    :param list/numpy.ndarray price_data2: price values for the second supply curve.
     :param str area: Either the load zone, state name, state abbreviation, or
         interconnect. Defaults to None because it's not essential.
     :param str gen_type: Generation type. Defaults to None because it's not essential.
-    :param bool plot: If True, the supply curve plot is shown. If False, the plot is
-        not shown.
+    :param bool plot: If True, the supply curves are plotted. If False, the plot is
+        not created.
+    :param bool show: If True, the plot is shown. If False, the figure is left open
+        and can be retrieved with :func:`matplotlib.pyplot.gcf`.
     :return: (*float*) -- The maximum price difference between the two supply curves.
-    :raises TypeError: if the capacity and price inputs are not provided as lists.
+    :raises TypeError: if the capacity and price inputs are not provided as lists or
+        one-dimensional arrays.
     :raises ValueError: if the supply curves do not offer the same amount of capacity.
     """
 
-    # Check that input capacities and prices are provided as lists
+    # Check that input capacities and prices are provided as lists or 1-D arrays
     if not all(
-        isinstance(i, list)
+        isinstance(i, (list, np.ndarray))
+        for i in [capacity_data1, price_data1, capacity_data2, price_data2]
+    ):
+        raise TypeError("Supply curve data must be input as lists or arrays.")
+    capacity_data1, price_data1, capacity_data2, price_data2 = (
+        np.asarray(i, dtype=float)
         for i in [capacity_data1, price_data1, capacity_data2, price_data2]
+    )
+    if any(
+        i.ndim != 1 for i in [capacity_data1, price_data1, capacity_data2, price_data2]
     ):
-        raise TypeError("Supply curve data must be input as lists.")
+        raise TypeError("Supply curve data must be one-dimensional.")
 
     # Check that the supply curves offer the same amount of capacity
-    if max(capacity_data1) != max(capacity_data2):
+    if capacity_data1.max() != capacity_data2.max():
         raise ValueError(
             "The two supply curves do not offer the same amount of capacity (MW)."
         )
 
-    # Create a list that has every capacity value in which either supply curve steps up
-    capacity_data_all = list(set(capacity_data1) | set(capacity_data2))
-    capacity_data_all.sort()
-
-    # For each capacity value, associate the two corresponding price values
-    price_data_all = []
-    for i in range(len(capacity_data_all)):
-        # Determine the correpsonding price from the first supply curve
-        if capacity_data_all[i] == capacity_data1[-1]:
-            f1 = price_data1[-1]
-        else:
-            f1 = price_data1[lower_bound_index(capacity_data_all[i], capacity_data1)]
-
-        # Determine the correpsonding price from the second supply curve
-        if capacity_data_all[i] == capacity_data2[-1]:
-            f2 = price_data2[-1]
-        else:
-            f2 = price_data2[lower_bound_index(capacity_data_all[i], capacity_data2)]
-
-        # Pair the two price values
-        price_data_all.append([f1, f2])
-
-    # Determine the price differences for each capacity value
-    price_data_diff = [
-        abs(price_data_all[i][0] - price_data_all[i][1])
-        for i in range(len(price_data_all))
-    ]
-
     # Determine the maximum price difference
-    max_diff = max(price_data_diff)
+    max_diff = _ks_core(capacity_data1, price_data1, capacity_data2, price_data2)
 
     # Plot the two supply curves overlaid
     if plot:
-        plt = _check_import("matplotlib.pyplot")
-        plt.figure(figsize=[20, 10])
-        plt.plot(capacity_data1, price_data1)
-        plt.plot(capacity_data2, price_data2)
         if None in {area, gen_type}:
-            plt.title("Supply Curve Comparison", fontsize=20)
+            title = "Supply Curve Comparison"
         else:
-            plt.title(
-                f"Supply curve comparison for {gen_type} generators in {area}",
-                fontsize=20,
-            )
-        plt.xlabel("Capacity (MW)", fontsize=20)
-        plt.ylabel("Price ($/MW)", fontsize=20)
-        plt.xticks(fontsize=20)
-        plt.yticks(fontsize=20)
-        plt.show()
+            title = f"Supply curve comparison for {gen_type} generators in {area}"
+        _plot_supply_curves(
+            [(capacity_data1, price_data1), (capacity_data2, price_data2)], title
+        )
+        _show_plot(show)
 
     # Return the maximum price difference (this corresponds to the K-S statistic)
     return max_diff
@@ -411,6 +555,7 @@ def plot_linear_vs_quadratic_terms(
     zoom=False,
     num_sd=3,
     alpha=0.1,
+    show=True,
 ):
     """Compares the linear (c1) and quadratic (c2) parameters from the quadratic
     generator cost curves.
@@ -422,29 +567,27 @@ def plot_linear_vs_quadratic_terms(
     :param str area_type: one of: *'loadzone'*, *'state'*, *'state_abbr'*,
         *'interconnect'*. Defaults to None, which allows
         :func:`powersimdata.network.model.area_to_loadzone` to infer the type.
-    :param bool plot: If True, the linear term vs. quadratic term plot is shown. If
-        False, the plot is not shown.
+    :param bool plot: If True, the linear term vs. quadratic term plot is created. If
+        False, the plot is not created.
     :param bool zoom: If True, filters out quadratic term outliers to enable better
         visualization. If False, there is no filtering.
     :param float/int num_sd: The number of standard deviations used to filter out
         quadratic term outliers.
     :param float alpha: The alpha blending value for the scatter plot; takes values
         between 0 (transparent) and 1 (opaque).
-    :return: (*None*) -- The linear term vs. quadratic term plot is displayed according
-        to the user.
+    :param bool show: If True, the plot is shown. If False, the figure is only
+        returned, e.g. to be saved in a batch run.
+    :return: (*matplotlib.figure.Figure*) -- the linear term vs. quadratic term plot
+        if plot is True and the area contains generators of the specified type, None
+        otherwise.
     :raises TypeError: if a powersimdata.input.grid.Grid object is not input.
     :raises ValueError: if the specified area or generator type is not applicable.
     """
 
-    plt = _check_import("matplotlib.pyplot")
-
     # Check that a Grid object is input
     if not isinstance(grid, Grid):
         raise TypeError("A Grid object must be input.")
 
-    # Obtain a copy of the Grid object
-    grid = copy.deepcopy(grid)
-
     # Access the generator cost and plant information data
     gencost_df = grid.gencost["before"]
     plant_df = grid.plant
@@ -467,14 +610,14 @@ def plot_linear_vs_quadratic_terms(
         raise ValueError(f"{gen_type} is not a valid generation type.")
 
     # Identify the load zones that correspond to the specified area and area_type
-    returned_zones = area_to_loadzone(grid.grid_model, area, area_type)
-
-    # Trim the DataFrame to only be of the desired area and generation type
-    supply_data = supply_data.loc[supply_data.zone_name.isin(returned_zones)]
-    supply_data = supply_data.loc[supply_data["type"] == gen_type]
+    returned_zones = _area_to_loadzone(grid.grid_model, area, area_type)
 
-    # Remove generators that have no capacity (e.g., Maine coal generators)
-    supply_data = supply_data[supply_data["Pmin"] != supply_data["Pmax"]]
+    # Trim the DataFrame to only be of the desired area and generation type, and
+    # remove generators that have no capacity (e.g., Maine coal generators)
+    keep = supply_data["type"].to_numpy() == gen_type
+    keep &= supply_data["zone_name"].isin(returned_zones).to_numpy()
+    keep &= supply_data["Pmin"].to_numpy() != supply_data["Pmax"].to_numpy()
+    supply_data = supply_data.iloc[np.flatnonzero(keep)]
 
     # Check if the area contains generators of the specified type
     if supply_data.empty:
@@ -484,25 +627,27 @@ def plot_linear_vs_quadratic_terms(
     zoom_name = ""
     if zoom:
         # Drop values outside a specified number of standard deviations of c2
-        quad_term_sd = np.std(supply_data["c2"])
-        quad_term_mean = np.mean(supply_data["c2"])
-        cutoff = quad_term_mean + num_sd * quad_term_sd
-        if len(supply_data[supply_data["c2"] > cutoff]) > 0:
+        quad_term = supply_data["c2"].to_numpy(float)
+        cutoff = quad_term.mean() + num_sd * quad_term.std()
+        keep = quad_term <= cutoff
+        if not keep.all():
             zoom = True
-            supply_data = supply_data[supply_data["c2"] <= cutoff]
-            max_ylim = np.max(supply_data["c2"] + 0.01)
-            min_ylim = np.min(supply_data["c2"] - 0.01)
-            max_xlim = np.max(supply_data["c1"] + 1)
-            min_xlim = np.min(supply_data["c1"] - 1)
+            supply_data = supply_data.iloc[np.flatnonzero(keep)]
+            quad_term = quad_term[keep]
+            lin_term = supply_data["c1"].to_numpy(float)
+            max_ylim = quad_term.max() + 0.01
+            min_ylim = quad_term.min() - 0.01
+            max_xlim = lin_term.max() + 1
+            min_xlim = lin_term.min() - 1
             zoom_name = "(zoomed)"
         else:
             zoom = False
 
     # Plot the c1 vs. c2 comparison
     if plot:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(20, 10)
-        plt.scatter(
+        plt = _check_import("matplotlib.pyplot")
+        fig, ax = plt.subplots(figsize=[20, 10])
+        points = ax.scatter(
             supply_data["c1"],
             supply_data["c2"],
             s=np.sqrt(supply_data["Pmax"]) * 10,
@@ -510,27 +655,27 @@ def plot_linear_vs_quadratic_terms(
             c=supply_data["Pmax"],
             cmap="plasma",
         )
-        plt.grid()
-        plt.title(
+        ax.grid()
+        ax.set_title(
             f"Linear term vs. Quadratic term for {gen_type} generator cost curves in "
             + f"{area} {zoom_name}",
             fontsize=20,
         )
         if zoom:
-            plt.ylim([min_ylim, max_ylim])
-            plt.xlim([min_xlim, max_xlim])
-        plt.xlabel("Linear Term", fontsize=20)
-        plt.ylabel("Quadratic Term", fontsize=20)
-        plt.xticks(fontsize=20)
-        plt.yticks(fontsize=20)
-        cbar = plt.colorbar()
+            ax.set_ylim([min_ylim, max_ylim])
+            ax.set_xlim([min_xlim, max_xlim])
+        ax.set_xlabel("Linear Term", fontsize=20)
+        ax.set_ylabel("Quadratic Term", fontsize=20)
+        ax.tick_params(labelsize=20)
+        cbar = fig.colorbar(points, ax=ax)
         cbar.set_label("Capacity (MW)", fontsize=20)
         cbar.ax.tick_params(labelsize=20)
-        plt.show()
+        _show_plot(show)
+        return fig
 
 
 def plot_capacity_vs_price(
-    grid, num_segments, area, gen_type, area_type=None, plot=True
+    grid, num_segments, area, gen_type, area_type=None, plot=True, show=True
 ):
     """Plots the generator capacity vs. the generator price for a specified area
         and generation type.
@@ -544,81 +689,45 @@ def plot_capacity_vs_price(
     :param str area_type: one of: *'loadzone'*, *'state'*, *'state_abbr'*,
         *'interconnect'*. Defaults to None, which allows
         :func:`powersimdata.network.model.area_to_loadzone` to infer the type.
-    :param bool plot: If True, the supply curve plot is shown. If False, the plot is
-        not shown.
-    :return: (*None*) -- The capacity vs. price plot is displayed according to the user.
+    :param bool plot: If True, the capacity vs. price plot is created. If False, the
+        plot is not created.
+    :param bool show: If True, the plot is shown. If False, the figure is only
+        returned, e.g. to be saved in a batch run.
+    :return: (*matplotlib.figure.Figure*) -- the capacity vs. price plot if plot is
+        True and the area contains generators of the specified type, None otherwise.
     :raises TypeError: if a powersimdata.input.grid.Grid object is not input.
     :raises ValueError: if the specified area or generator type is not applicable.
     """
 
-    plt = _check_import("matplotlib.pyplot")
-
-    # Check that a Grid object is input
-    if not isinstance(grid, Grid):
-        raise TypeError("A Grid object must be input.")
-
-    # Check that the desired number of linearized cost curve segments is an int
-    if not isinstance(num_segments, int):
-        raise TypeError(
-            "The number of linearized cost curve segments must be input as an int."
-        )
-
-    # Obtain the desired generator cost and plant information data
-    supply_data = get_supply_data(grid, num_segments)
-
-    # Check the input supply data
-    check_supply_data(supply_data, num_segments)
-
-    # Check to make sure the generator type is valid
-    if gen_type not in supply_data["type"].unique():
-        raise ValueError(f"{gen_type} is not a valid generation type.")
-
-    # Identify the load zones that correspond to the specified area and area_type
-    returned_zones = area_to_loadzone(grid.grid_model, area, area_type)
-
-    # Trim the DataFrame to only be of the desired area and generation type
-    supply_data = supply_data.loc[supply_data.zone_name.isin(returned_zones)]
-    supply_data = supply_data.loc[supply_data["type"] == gen_type]
-
-    # Remove generators that have no capacity (e.g., Maine coal generators)
-    if supply_data["slope1"].isnull().values.any():
-        supply_data.dropna(subset=["slope1"], inplace=True)
+    # Obtain the p_diff and slope of each cost segment in the area
+    supply_df = _get_segment_data(grid, num_segments, area, gen_type, area_type)
 
     # Check if the area contains generators of the specified type
-    if supply_data.empty:
+    if supply_df.empty:
         return
 
-    # Combine the p_diff and slope information for each cost segment
-    supply_df_cols = []
-    for i in range(num_segments):
-        supply_df_cols.append(
-            supply_data.loc[:, ("p_diff" + str(i + 1), "slope" + str(i + 1))]
-        )
-        supply_df_cols[i].rename(
-            columns={"p_diff" + str(i + 1): "p_diff", "slope" + str(i + 1): "slope"},
-            inplace=True,
-        )
-    supply_df = pd.concat(supply_df_cols, axis=0)
-    supply_df = supply_df.reset_index(drop=True)
-
     # Determine the average price
-    total_capacity = supply_df["p_diff"].sum()
+    p_diff = supply_df["p_diff"].to_numpy(float)
+    total_capacity = p_diff.sum()
     if total_capacity == 0:
         average_price = 0
     else:
         average_price = (
-            supply_df["slope"] * supply_df["p_diff"]
-        ).sum() / total_capacity
+            np.dot(supply_df["slope"].to_numpy(float), p_diff) / total_capacity
+        )
 
     # Plot the comparison
     if plot:
-        ax = supply_df.plot.scatter(
-            x="p_diff", y="slope", s=50, figsize=[20, 10], grid=True, fontsize=20
+        plt = _check_import("matplotlib.pyplot")
+        fig, ax = plt.subplots(figsize=[20, 10])
+        supply_df.plot.scatter(
+            x="p_diff", y="slope", s=50, grid=True, fontsize=20, ax=ax
         )
-        plt.title(
+        ax.set_title(
             f"Capacity vs. Price for {gen_type} generators in {area}", fontsize=20
         )
-        plt.xlabel("Segment Capacity (MW)", fontsize=20)
-        plt.ylabel("Segment Price ($/MW)", fontsize=20)
-        ax.plot(supply_df["p_diff"], [average_price] * len(supply_df.index), c="red")
-        plt.show()
+        ax.set_xlabel("Segment Capacity (MW)", fontsize=20)
+        ax.set_ylabel("Segment Price ($/MW)", fontsize=20)
+        ax.plot(p_diff, np.full(len(p_diff), average_price), c="red")
+        _show_plot(show)
+        return fig
@@ -1,3 +1,6 @@
+import copy
+
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_series_equal
 
@@ -5,6 +8,7 @@ from powersimdata.design.generation.cost_curves import (
     build_supply_curve,
     get_supply_data,
     ks_test,
+    load_supply_data,
     lower_bound_index,
 )
 from powersimdata.tests.mock_grid import MockGrid
@@ -174,6 +178,19 @@ def test_get_supply_data():
     assert_series_equal(test_slope, exp_slope)
 
 
+def test_get_supply_data_is_cached():
+    supply_df = get_supply_data(grid, 1)
+    exp_slope = supply_df["slope1"].copy()
+    supply_df["slope1"] = 0
+    assert_series_equal(get_supply_data(grid, 1)["slope1"], exp_slope)
+
+
+def test_load_supply_data(tmp_path):
+    path = str(tmp_path / "supply_data.csv")
+    supply_df = get_supply_data(grid, 1, save=path)
+    assert_series_equal(load_supply_data(path)["slope1"], supply_df["slope1"])
+
+
 def test_build_supply_curve_1seg():
     capacity_test, price_test = build_supply_curve(
         grid, 1, "Colorado", "ng", "loadzone", plot=False
@@ -195,6 +212,16 @@ def test_build_supply_curve_1seg():
     assert all([price_test[i] == price_exp[i] for i in range(len(capacity_test))])
 
 
+def test_build_supply_curve_skips_generators_without_capacity():
+    attrs = copy.deepcopy(grid_attrs)
+    attrs["plant"]["Pmax"][5] = 0
+    capacity_test, price_test = build_supply_curve(
+        MockGrid(attrs), 1, "Colorado", "ng", "loadzone", plot=False
+    )
+    assert capacity_test == [0, 20, 20, 40, 40, 90, 90, 190]
+    assert price_test == [30.40, 30.40, 30.40, 30.40, 31.25, 31.25, 40.00, 40.00]
+
+
 def test_build_supply_curve_2seg():
     capacity_test, price_test = build_supply_curve(
         grid, 2, "Utah", "coal", "loadzone", plot=False
@@ -267,3 +294,17 @@ def test_lower_bound_index():
     ind_test = lower_bound_index(desired_capacity, capacity_data)
     ind_exp = 4
     assert ind_test == ind_exp
+
+
+def test_ks_test_array_input():
+    capacity_data1, price_data1 = build_supply_curve(
+        grid, 1, "Washington", "coal", "loadzone", plot=False
+    )
+    test_diff = ks_test(
+        np.array(capacity_data1),
+        np.array(price_data1),
+        capacity_data1,
+        np.array(price_data1) + 1,
+        plot=False,
+    )
+    assert test_diff == 1
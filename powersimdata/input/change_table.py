@@ -1,6 +1,10 @@
 import copy
 import os
 import pickle
+import sys
+
+import numpy as np
+import pandas as pd
 
 from powersimdata.design.transmission.upgrade import (
     scale_congested_mesh_branches,
@@ -8,7 +12,7 @@ from powersimdata.design.transmission.upgrade import (
 )
 from powersimdata.input.transform_grid import TransformGrid
 from powersimdata.utility import server_setup
-from powersimdata.utility.distance import find_closest_neighbor
+from powersimdata.utility.distance import build_neighbor_tree, find_closest_neighbors
 
 _resources = (
     "coal",
@@ -26,6 +30,52 @@ _resources = (
 
 _renewable_resource = {"hydro", "solar", "wind", "wind_offshore"}
 
+_clear_allowed = frozenset({"branch", "dcline", "demand", "plant", "storage"})
+_clear_top_level = ("demand", "storage")
+_clear_line_types = ("branch", "dcline")
+_clear_line_prefixes = ("", "new_")
+_clear_plant_suffixes = ("", "_cost", "_pmin")
+
+_new_bus_required = frozenset({"lat", "lon"})
+_new_bus_xor_sets = frozenset({("zone_id", "zone_name")})
+_new_bus_defaults = {"Pd": 0, "baseKV": 230}
+_new_bus_allowable = frozenset(
+    _new_bus_required.union(*_new_bus_xor_sets, _new_bus_defaults)
+)
+
+_new_element_keys = ("new_bus", "new_branch", "new_dcline", "new_plant")
+
+
+def _first_true(mask):
+    """Returns the position of the first True value of a boolean mask.
+
+    :param numpy.ndarray/pandas.Series mask: boolean mask.
+    :return: (*int*) -- position of the first True value, None if there is none.
+    """
+    position = np.flatnonzero(mask)
+    return position[0] if len(position) > 0 else None
+
+
+def _missing_ids(ids, index):
+    """Returns the identification numbers which are not in an index.
+
+    :param iterable ids: identification numbers.
+    :param pandas.Index index: index to look the identification numbers up in.
+    :return: (*list*) -- identification numbers missing from the index.
+    """
+    ids = list(ids)
+    return [ids[i] for i in np.flatnonzero(index.get_indexer(ids) == -1)]
+
+
+def _intern_keys(entries):
+    """Interns the keys of new element entries, so that every entry shares the same
+    key objects and the pickled change table stores each key only once.
+
+    :param list entries: each entry is a dictionary describing a new element.
+    :return: (*list*) -- entries with interned keys.
+    """
+    return [{sys.intern(k): v for k, v in entry.items()} for entry in entries]
+
 
 def ordinal(n):
     """Translate a 0-based index into a 1-based ordinal, e.g. 0 -> 1st, 1 -> 2nd, etc.
@@ -124,6 +174,11 @@ class ChangeTable:
         keys in the dictionary are: *'lat'*, *'lon'*, one of *'zone_id'*/*'zone_name'*,
         and optionally *'Pd'*, specifying the location of the bus, the demand zone, and
         optionally the nominal demand at that bus (defaults to 0).
+
+    The grid tables anticipating the new elements are cached and refreshed whenever
+    new elements are added or cleared through the methods of this class. Entries of
+    the *'new_[element]'* lists that are edited or replaced directly in :attr:`ct`
+    are not tracked and may leave these tables stale.
     """
 
     def __init__(self, grid):
@@ -131,9 +186,44 @@ class ChangeTable:
 
         :param powersimdata.input.grid.Grid grid: a Grid object
         """
+        self._new_element_revision = 0
         self.grid = grid
         self.ct = {}
-        self._new_element_caches = {k: {} for k in {"branch", "bus", "dcline", "plant"}}
+
+    @property
+    def grid(self):
+        """Returns the grid the change table applies to.
+
+        :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
+        """
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid):
+        """Sets the grid the change table applies to and resets the tables, plant
+        groupings, load zone names and plant location trees derived from it.
+
+        :param powersimdata.input.grid.Grid grid: a Grid object
+        """
+        self._grid = grid
+        self._new_element_revision += 1
+        self._new_element_tables = {}
+        self._plant_groups = {}
+        self._zone_names = None
+        self._plant_trees = {}
+
+    def _get_plant_groups(self, by):
+        """Returns the plant identification numbers grouped by plant column(s). The
+        grouping is computed once per grid and reused afterwards.
+
+        :param str/list by: column(s) of the plant data frame to group by.
+        :return: (*dict*) -- keys are the group labels and values are the plant
+            identification numbers (*pandas.Index*) in each group.
+        """
+        key = by if isinstance(by, str) else tuple(by)
+        if key not in self._plant_groups:
+            self._plant_groups[key] = self.grid.plant.groupby(by).groups
+        return self._plant_groups[key]
 
     @staticmethod
     def _check_resource(resource):
@@ -142,30 +232,42 @@ class ChangeTable:
         :param str resource: type of generator.
         :raises ValueError: if resource cannot be changed.
         """
-        possible = _resources
-        if resource not in possible:
-            print("-----------------------")
-            print("Possible Generator type")
-            print("-----------------------")
-            for p in possible:
-                print(p)
-            raise ValueError("Invalid resource: %s" % resource)
+        if resource not in _resources:
+            raise ValueError(
+                f"Invalid resource: {resource}. "
+                f"Possible generator types are: {', '.join(_resources)}"
+            )
 
     def _check_zone(self, zone_name):
         """Checks load zones.
 
-        :param list zone_name: load zones.
+        :param iterable zone_name: load zones.
         :raise ValueError: if zone(s) do(es) not exist.
         """
-        possible = list(self.grid.plant.zone_name.unique())
+        if self._zone_names is None:
+            self._zone_names = frozenset(self.grid.plant.zone_name.unique())
         for z in zone_name:
-            if z not in possible:
-                print("--------------")
-                print("Possible zones")
-                print("--------------")
-                for p in possible:
-                    print(p)
-                raise ValueError("Invalid load zone(s): %s" % " | ".join(zone_name))
+            if z not in self._zone_names:
+                possible = ", ".join(self.grid.plant.zone_name.unique())
+                raise ValueError(
+                    "Invalid load zone(s): %s. Possible zones are: %s"
+                    % (" | ".join(zone_name), possible)
+                )
+
+    def _get_plant_tree(self, resource):
+        """Returns a tree locating the plants fueled by specified resource. The tree is
+        built once per grid and reused afterwards.
+
+        :param str resource: type of generator to consider.
+        :return: (*scipy.spatial.cKDTree*) -- tree of the plant locations, in the
+            order of the plant identification numbers in the resource group.
+        """
+        if resource not in self._plant_trees:
+            plant_id = self._get_plant_groups("type")[resource]
+            self._plant_trees[resource] = build_neighbor_tree(
+                self.grid.plant.loc[plant_id, ["lon", "lat"]].to_numpy()
+            )
+        return self._plant_trees[resource]
 
     def _get_plant_id(self, zone_name, resource):
         """Returns the plant identification number of all the generators
@@ -176,17 +278,10 @@ class ChangeTable:
         :return: (*list*) -- plant identification number of all the generators
             located in zone and fueled by resource.
         """
-        plant_id = []
-        try:
-            plant_id = (
-                self.grid.plant.groupby(["zone_name", "type"])
-                .get_group((zone_name, resource))
-                .index.values.tolist()
-            )
-        except KeyError:
-            pass
-
-        return plant_id
+        plant_id = self._get_plant_groups(["zone_name", "type"]).get(
+            (zone_name, resource)
+        )
+        return [] if plant_id is None else plant_id.tolist()
 
     def clear(self, which=None):
         """Clear all or part of the change table.
@@ -194,26 +289,26 @@ class ChangeTable:
         :param str/set which: str or set of strings of what to clear from self.ct
             If None (default), everything is cleared.
         """
+        self._new_element_revision += 1
         # Clear all
         if which is None:
             self.ct.clear()
             return
         # Input validation
-        allowed = {"branch", "dcline", "demand", "plant", "storage"}
         if isinstance(which, str):
             which = {which}
         if not isinstance(which, set):
             raise TypeError("Which must be a str, a set, or None (defaults to all)")
-        if not which <= allowed:
-            raise ValueError("which must contain only: " + " | ".join(allowed))
+        if not which <= _clear_allowed:
+            raise ValueError("which must contain only: " + " | ".join(_clear_allowed))
         # Clear only top-level keys specified in which
-        for key in {"demand", "storage"}:
+        for key in _clear_top_level:
             if key in which:
                 del self.ct[key]
         # Clear multiple keys for each entry in which
-        for line_type in {"branch", "dcline"}:
+        for line_type in _clear_line_types:
             if line_type in which:
-                for prefix in {"", "new_"}:
+                for prefix in _clear_line_prefixes:
                     key = prefix + line_type
                     if key in self.ct:
                         del self.ct[key]
@@ -221,7 +316,7 @@ class ChangeTable:
             if "new_plant" in self.ct:
                 del self.ct["new_plant"]
             for r in _resources:
-                for suffix in {"", "_cost", "_pmin"}:
+                for suffix in _clear_plant_suffixes:
                     key = r + suffix
                     if key in self.ct:
                         del self.ct[key]
@@ -237,46 +332,53 @@ class ChangeTable:
         :param dict plant_id: identification numbers of plants. The key(s) is
             (are) the id of the plant(s) and the associated value is the entry for
             that generator.
-        :raise ValueError: if any values within zone_name or plant_id are negative.
+        :raise ValueError: if neither zone_name nor plant_id is set, if any zone or
+            plant does not exist or if any values within zone_name or plant_id are
+            negative.
         """
         self._check_resource(resource)
-        if bool(zone_name) or bool(plant_id) is True:
-            if ct_key not in self.ct:
-                self.ct[ct_key] = {}
-            if zone_name is not None:
-                try:
-                    self._check_zone(list(zone_name.keys()))
-                except ValueError:
-                    self.ct.pop(ct_key)
-                    raise
-                if not all([v >= 0 for v in zone_name.values()]):
-                    raise ValueError(f"All entries for {ct_key} must be non-negative")
-                if "zone_id" not in self.ct[ct_key]:
-                    self.ct[ct_key]["zone_id"] = {}
-                for z in zone_name.keys():
-                    if len(self._get_plant_id(z, resource)) == 0:
-                        print("No %s plants in %s." % (resource, z))
-                    else:
-                        zone_id = self.grid.zone2id[z]
-                        self.ct[ct_key]["zone_id"][zone_id] = zone_name[z]
-                if len(self.ct[ct_key]["zone_id"]) == 0:
-                    self.ct.pop(ct_key)
-            if plant_id is not None:
-                anticipated_plant = self._get_df_with_new_elements("plant")
-                diff = set(plant_id.keys()) - set(anticipated_plant.index)
-                if len(diff) != 0:
-                    err_msg = f"No {resource} plant(s) with the following id: "
-                    err_msg += ", ".join(sorted([str(d) for d in diff]))
-                    self.ct.pop(ct_key)
-                    raise ValueError(err_msg)
-                if not all([v >= 0 for v in plant_id.values()]):
-                    raise ValueError(f"All entries for {ct_key} must be non-negative")
-                if "plant_id" not in self.ct[ct_key]:
-                    self.ct[ct_key]["plant_id"] = {}
-                for i in plant_id.keys():
-                    self.ct[ct_key]["plant_id"][i] = plant_id[i]
-        else:
+        if not (zone_name or plant_id):
             raise ValueError("<zone> and/or <plant_id> must be set.")
+        self.ct.setdefault(ct_key, {})
+        if zone_name is not None:
+            try:
+                self._check_zone(zone_name.keys())
+            except ValueError:
+                self.ct.pop(ct_key)
+                raise
+            if not all(v >= 0 for v in zone_name.values()):
+                raise ValueError(f"All entries for {ct_key} must be non-negative")
+            self.ct[ct_key].setdefault("zone_id", {})
+            for z in zone_name.keys():
+                if len(self._get_plant_id(z, resource)) == 0:
+                    print("No %s plants in %s." % (resource, z))
+                else:
+                    zone_id = self.grid.zone2id[z]
+                    self.ct[ct_key]["zone_id"][zone_id] = zone_name[z]
+            if len(self.ct[ct_key]["zone_id"]) == 0:
+                self.ct.pop(ct_key)
+        if plant_id is not None:
+            anticipated_plant = self._get_df_with_new_elements("plant")
+            diff = _missing_ids(plant_id, anticipated_plant.index)
+            if len(diff) != 0:
+                self._reject(
+                    ct_key,
+                    f"No {resource} plant(s) with the following id: "
+                    + ", ".join(sorted(str(d) for d in diff)),
+                )
+            if not all(v >= 0 for v in plant_id.values()):
+                raise ValueError(f"All entries for {ct_key} must be non-negative")
+            self.ct[ct_key].setdefault("plant_id", {}).update(plant_id)
+
+    def _reject(self, ct_key, err_msg):
+        """Removes a top-level key from the change table and raises an error.
+
+        :param str ct_key: top-level key of the change table to remove.
+        :param str err_msg: error message.
+        :raises ValueError: always.
+        """
+        self.ct.pop(ct_key, None)
+        raise ValueError(err_msg)
 
     def scale_plant_capacity(self, resource, zone_name=None, plant_id=None):
         """Sets plant capacity scaling factor in change table.
@@ -321,9 +423,18 @@ class ChangeTable:
             scaling factor for the minimum generation of the generator.
         """
         self._add_plant_entries(resource, f"{resource}_pmin", zone_name, plant_id)
-        # Check for situations where Pmin would be scaled above Pmax
-        candidate_grid = TransformGrid(self.grid, self.ct).get_grid()
-        pmax_pmin_ratio = candidate_grid.plant.Pmax / candidate_grid.plant.Pmin
+        if f"{resource}_pmin" not in self.ct:
+            return
+        # Check for situations where Pmin would be scaled above Pmax, starting from
+        # the unscaled Pmin/Pmax of the original and the new plants
+        plant = self._get_unscaled_plant(resource)
+        capacity_scaling = self._get_plant_scaling(resource, resource, plant.index)
+        pmin_scaling = self._get_plant_scaling(
+            resource, f"{resource}_pmin", plant.index
+        )
+        pmax_pmin_ratio = (plant.Pmax * capacity_scaling) / (
+            plant.Pmin * capacity_scaling * pmin_scaling
+        )
         to_be_clipped = pmax_pmin_ratio < 1
         num_clipped = to_be_clipped.sum()
         if num_clipped > 0:
@@ -333,13 +444,50 @@ class ChangeTable:
             )
             print(err_msg)
             # Add by-plant correction factors as necessary
-            for plant_id, correction in pmax_pmin_ratio[to_be_clipped].items():
-                if "plant_id" not in self.ct[f"{resource}_pmin"]:
-                    self.ct[f"{resource}_pmin"]["plant_id"] = {}
-                if plant_id in self.ct[f"{resource}_pmin"]["plant_id"]:
-                    self.ct[f"{resource}_pmin"]["plant_id"][plant_id] *= correction
-                else:
-                    self.ct[f"{resource}_pmin"]["plant_id"][plant_id] = correction
+            correction = pmax_pmin_ratio[to_be_clipped]
+            scaling = self.ct[f"{resource}_pmin"].setdefault("plant_id", {})
+            current = pd.Series(scaling, dtype=float).reindex(
+                correction.index, fill_value=1.0
+            )
+            scaling.update((current * correction).to_dict())
+
+    def _get_unscaled_plant(self, resource):
+        """Returns the Pmin and Pmax of the plants of the original grid and of the
+        new plants, before any scaling from the change table.
+
+        :param str resource: type of generator to consider.
+        :return: (*pandas.DataFrame*) -- Pmin and Pmax, indexed by plant_id.
+        """
+        plant = self.grid.plant
+        unscaled = plant.loc[plant.type == resource, ["Pmin", "Pmax"]]
+        new_plant = self.ct.get("new_plant", [])
+        if len(new_plant) == 0:
+            return unscaled
+        # New plants are numbered after the last plant of the original grid
+        new = pd.DataFrame(
+            new_plant,
+            columns=["type", "Pmin", "Pmax"],
+            index=plant.index[-1] + 1 + np.arange(len(new_plant)),
+        )
+        return pd.concat([unscaled, new.loc[new.type == resource, ["Pmin", "Pmax"]]])
+
+    def _get_plant_scaling(self, resource, ct_key, plant_id):
+        """Returns the scaling factors that the change table applies to plants, by
+        zone first and then by plant id.
+
+        :param str resource: type of generator to consider.
+        :param str ct_key: top-level key of the change table to consider.
+        :param pandas.Index plant_id: identification numbers of the plants.
+        :return: (*pandas.Series*) -- scaling factor of each plant, indexed by plant_id.
+        """
+        scaling = pd.Series(1.0, index=plant_id)
+        entries = self.ct.get(ct_key, {})
+        # Zone scaling only applies to plants of the original grid
+        zone_groups = self._get_plant_groups(["zone_id", "type"])
+        for zone_id, factor in entries.get("zone_id", {}).items():
+            scaling[zone_groups.get((zone_id, resource), [])] *= factor
+        by_id = pd.Series(entries.get("plant_id", {}), dtype=float)
+        return scaling * by_id.reindex(plant_id, fill_value=1.0)
 
     def scale_branch_capacity(self, zone_name=None, branch_id=None):
         """Sets branch capacity scaling factor in change table.
@@ -351,37 +499,31 @@ class ChangeTable:
         :param dict branch_id: identification numbers of branches. The key(s)
             is (are) the id of the line(s) and the associated value is the
             scaling factor for the increase/decrease in capacity of the line(s).
+        :raises ValueError: if neither zone_name nor branch_id is set, or if any zone
+            or branch does not exist.
         """
+        if not (zone_name or branch_id):
+            raise ValueError("<zone> and/or <branch_id> must be set.")
         anticipated_branch = self._get_df_with_new_elements("branch")
-        if bool(zone_name) or bool(branch_id) is True:
-            if "branch" not in self.ct:
-                self.ct["branch"] = {}
-            if zone_name is not None:
-                try:
-                    self._check_zone(list(zone_name.keys()))
-                except ValueError:
-                    self.ct.pop("branch")
-                    return
-                if "zone_id" not in self.ct["branch"]:
-                    self.ct["branch"]["zone_id"] = {}
-                for z in zone_name.keys():
-                    self.ct["branch"]["zone_id"][self.grid.zone2id[z]] = zone_name[z]
-            if branch_id is not None:
-                diff = set(branch_id.keys()) - set(anticipated_branch.index)
-                if len(diff) != 0:
-                    print("No branch with the following id:")
-                    for i in list(diff):
-                        print(i)
-                    self.ct.pop("branch")
-                    return
-                else:
-                    if "branch_id" not in self.ct["branch"]:
-                        self.ct["branch"]["branch_id"] = {}
-                    for i in branch_id.keys():
-                        self.ct["branch"]["branch_id"][i] = branch_id[i]
-        else:
-            print("<zone> and/or <branch_id> must be set. Return.")
-            return
+        self.ct.setdefault("branch", {})
+        if zone_name is not None:
+            try:
+                self._check_zone(zone_name.keys())
+            except ValueError:
+                self.ct.pop("branch")
+                raise
+            self.ct["branch"].setdefault("zone_id", {}).update(
+                {self.grid.zone2id[z]: v for z, v in zone_name.items()}
+            )
+        if branch_id is not None:
+            diff = _missing_ids(branch_id, anticipated_branch.index)
+            if len(diff) != 0:
+                self._reject(
+                    "branch",
+                    "No branch with the following id: "
+                    + ", ".join(str(i) for i in diff),
+                )
+            self.ct["branch"].setdefault("branch_id", {}).update(branch_id)
 
     def scale_dcline_capacity(self, dcline_id):
         """Sets DC line capacity scaling factor in change table.
@@ -389,22 +531,17 @@ class ChangeTable:
         :param dict dcline_id: identification numbers of dc line. The key(s) is
             (are) the id of the line(s) and the associated value is the scaling
             factor for the increase/decrease in capacity of the line(s).
+        :raises ValueError: if any dc line does not exist.
         """
-        if "dcline" not in self.ct:
-            self.ct["dcline"] = {}
+        self.ct.setdefault("dcline", {})
         anticipated_dcline = self._get_df_with_new_elements("dcline")
-        diff = set(dcline_id.keys()) - set(anticipated_dcline.index)
+        diff = _missing_ids(dcline_id, anticipated_dcline.index)
         if len(diff) != 0:
-            print("No dc line with the following id:")
-            for i in list(diff):
-                print(i)
-            self.ct.pop("dcline")
-            return
-        else:
-            if "dcline_id" not in self.ct["dcline"]:
-                self.ct["dcline"]["dcline_id"] = {}
-            for i in dcline_id.keys():
-                self.ct["dcline"]["dcline_id"][i] = dcline_id[i]
+            self._reject(
+                "dcline",
+                "No dc line with the following id: " + ", ".join(str(i) for i in diff),
+            )
+        self.ct["dcline"].setdefault("dcline_id", {}).update(dcline_id)
 
     def scale_demand(self, zone_name=None, zone_id=None):
         """Sets load scaling factor in change table.
@@ -415,35 +552,30 @@ class ChangeTable:
         :param dict zone_id: identification numbers of the load zones. The
             key(s) is (are) the id of the zone(s) and the associated value is
             the scaling factor for the increase/decrease in load.
+        :raises ValueError: if neither zone_name nor zone_id is set, or if any zone
+            does not exist.
         """
-        if bool(zone_name) or bool(zone_id) is True:
-            if "demand" not in self.ct:
-                self.ct["demand"] = {}
-            if "zone_id" not in self.ct["demand"]:
-                self.ct["demand"]["zone_id"] = {}
-            if zone_name is not None:
-                try:
-                    self._check_zone(list(zone_name.keys()))
-                except ValueError:
-                    self.ct.pop("demand")
-                    return
-                for z in zone_name.keys():
-                    self.ct["demand"]["zone_id"][self.grid.zone2id[z]] = zone_name[z]
-            if zone_id is not None:
-                zone_id_interconnect = set(self.grid.id2zone.keys())
-                diff = set(zone_id.keys()).difference(zone_id_interconnect)
-                if len(diff) != 0:
-                    print("No zone with the following id:")
-                    for i in list(diff):
-                        print(i)
-                    self.ct.pop("demand")
-                    return
-                else:
-                    for i in zone_id.keys():
-                        self.ct["demand"]["zone_id"][i] = zone_id[i]
-        else:
-            print("<zone> and/or <zone_id> must be set. Return.")
-            return
+        if not (zone_name or zone_id):
+            raise ValueError("<zone> and/or <zone_id> must be set.")
+        self.ct.setdefault("demand", {}).setdefault("zone_id", {})
+        if zone_name is not None:
+            try:
+                self._check_zone(zone_name.keys())
+            except ValueError:
+                self.ct.pop("demand")
+                raise
+            self.ct["demand"]["zone_id"].update(
+                {self.grid.zone2id[z]: v for z, v in zone_name.items()}
+            )
+        if zone_id is not None:
+            diff = zone_id.keys() - self.grid.id2zone.keys()
+            if len(diff) != 0:
+                self._reject(
+                    "demand",
+                    "No zone with the following id: "
+                    + ", ".join(sorted(str(i) for i in diff)),
+                )
+            self.ct["demand"]["zone_id"].update(zone_id)
 
     def scale_renewable_stubs(self, **kwargs):
         """Scales undersized stub branches connected to renewable generators.
@@ -508,7 +640,9 @@ class ChangeTable:
         anticipated_bus = self._get_df_with_new_elements("bus")
         for i, storage in enumerate(info):
             self._check_entry_keys(storage, i, "storage", required, None, optional)
-            if storage["bus_id"] not in anticipated_bus.index:
+        bus_pos = anticipated_bus.index.get_indexer([s["bus_id"] for s in info])
+        for i, storage in enumerate(info):
+            if bus_pos[i] == -1:
                 raise ValueError(
                     f"No bus id {storage['bus_id']} available for {ordinal(i)} storage"
                 )
@@ -529,9 +663,7 @@ class ChangeTable:
                         f"value for {k} must be <=1, bad value for {ordinal(i)} storage"
                     )
             new_storages.append(storage)
-        if "storage" not in self.ct:
-            self.ct["storage"] = []
-        self.ct["storage"] += new_storages
+        self.ct.setdefault("storage", []).extend(_intern_keys(new_storages))
 
     def add_dcline(self, info):
         """Adds HVDC line(s).
@@ -563,7 +695,9 @@ class ChangeTable:
             raise TypeError("Argument enclosing new AC line(s) must be a list")
         self._add_line("new_branch", info)
 
-    def _check_entry_keys(self, entry, n, key, required, xor_sets=None, optional=None):
+    def _check_entry_keys(
+        self, entry, n, key, required, xor_sets=None, optional=None, allowable_keys=None
+    ):
         """Check the validity of the dict keys used to add new components to the
         network (e.g. plants, AC lines), checking for: missing keys, extra keys, or
         incompatible sets of keys.
@@ -575,6 +709,8 @@ class ChangeTable:
         :param set xor_sets: set of tuples, for which exactly one key must be specified.
         :param set optional: set of acceptable keys which are not required or in an xor
             set.
+        :param frozenset allowable_keys: union of the required, xor and optional keys.
+            Computed from them if None.
         :raises TypeError: if entry is not a dict.
         :raises ValueError: if any required keys are missing, the number of specified
             keys in each xor set is not exactly one, or an unexpected key is received.
@@ -584,19 +720,21 @@ class ChangeTable:
         nth = ordinal(n)
         if not isinstance(entry, dict):
             raise TypeError(f"Each entry must be a dictionary, error on {nth} {key}")
-        if len(required - entry.keys()) > 0:
-            missing_keys = required - entry.keys()
+        keys = entry.keys()
+        missing_keys = required - keys
+        if missing_keys:
             raise ValueError(
                 f"Each entry of {key} requires keys of: {', '.join(sorted(required))}. "
                 f"Missing {sorted(missing_keys)} on {nth} entry, possibly others."
             )
-        allowable_keys = required | optional | set().union(*xor_sets)
-        if not set(entry.keys()) <= allowable_keys:
-            unknown_keys = set(entry.keys()) - allowable_keys
+        if allowable_keys is None:
+            allowable_keys = required | optional | set().union(*xor_sets)
+        if not keys <= allowable_keys:
+            unknown_keys = keys - allowable_keys
             err_msg = f"Got unknown keys in {nth} {key}: {', '.join(unknown_keys)}"
             raise ValueError(err_msg)
         for xor_set in sorted(xor_sets):
-            if len(xor_set & entry.keys()) != 1:
+            if sum(k in keys for k in xor_set) != 1:
                 err_msg = f"For {key}, must specify one of {xor_set} but not both"
                 err_msg += f". Error on {nth} entry, possibly others"
                 raise ValueError(err_msg)
@@ -610,19 +748,30 @@ class ChangeTable:
         """
         info = copy.deepcopy(info)
         anticipated_bus = self._get_df_with_new_elements("bus")
+        bus_lat = anticipated_bus["lat"].to_numpy()
+        bus_lon = anticipated_bus["lon"].to_numpy()
+        bus_interconnect = anticipated_bus["interconnect"].to_numpy()
         new_lines = []
         required = {"from_bus_id", "to_bus_id"}
         xor_sets = {("capacity", "Pmax"), ("capacity", "Pmin")}
         optional = {"Pmin"}
         for i, line in enumerate(info):
             self._check_entry_keys(line, i, key, required, xor_sets, optional)
+        from_bus_pos = anticipated_bus.index.get_indexer(
+            [line["from_bus_id"] for line in info]
+        )
+        to_bus_pos = anticipated_bus.index.get_indexer(
+            [line["to_bus_id"] for line in info]
+        )
+        for i, line in enumerate(info):
             start = line["from_bus_id"]
             end = line["to_bus_id"]
-            if start not in anticipated_bus.index:
+            start_pos, end_pos = from_bus_pos[i], to_bus_pos[i]
+            if start_pos == -1:
                 raise ValueError(
                     "No bus with the following id for line #%d: %d" % (i + 1, start)
                 )
-            if end not in anticipated_bus.index:
+            if end_pos == -1:
                 raise ValueError(
                     "No bus with the following id for line #%d: %d" % (i + 1, end)
                 )
@@ -637,7 +786,7 @@ class ChangeTable:
                 line["Pmax"] = line["capacity"]
                 line["Pmin"] = -1 * line["capacity"]
                 del line["capacity"]
-            elif {"Pmin", "Pmax"} < set(line.keys()):
+            elif line.keys() > {"Pmin", "Pmax"}:
                 if key == "new_branch":
                     err_msg = "Can't independently set Pmin & Pmax for AC branches"
                     raise ValueError(err_msg)
@@ -650,22 +799,19 @@ class ChangeTable:
                 raise ValueError("Must specify either 'capacity' or Pmin and Pmax")
             if (
                 key == "new_branch"
-                and anticipated_bus.interconnect[start]
-                != anticipated_bus.interconnect[end]
+                and bus_interconnect[start_pos] != bus_interconnect[end_pos]
             ):
                 raise ValueError(
                     "Buses of line #%d must be in same interconnect" % (i + 1)
                 )
             elif (
-                anticipated_bus.lat[start] == anticipated_bus.lat[end]
-                and anticipated_bus.lon[start] == anticipated_bus.lon[end]
+                bus_lat[start_pos] == bus_lat[end_pos]
+                and bus_lon[start_pos] == bus_lon[end_pos]
             ):
                 raise ValueError("Distance between buses of line #%d is 0" % (i + 1))
             new_lines.append(line)
 
-        if key not in self.ct:
-            self.ct[key] = []
-        self.ct[key] += new_lines
+        self._add_new_elements(key, new_lines)
 
     def add_plant(self, info):
         """Sets parameters of new generator(s) in change table.
@@ -685,45 +831,53 @@ class ChangeTable:
 
         info = copy.deepcopy(info)
         anticipated_bus = self._get_df_with_new_elements("bus")
-        new_plants = []
+        bus_lat = anticipated_bus["lat"].to_numpy()
+        bus_lon = anticipated_bus["lon"].to_numpy()
         required = {"bus_id", "Pmax", "type"}
         optional = {"c0", "c1", "c2", "Pmin"}
         for i, plant in enumerate(info):
             self._check_entry_keys(plant, i, "plant", required, None, optional)
             self._check_resource(plant["type"])
-            if plant["bus_id"] not in anticipated_bus.index:
-                raise ValueError(
-                    f"No bus id {plant['bus_id']} available for plant #{i + 1}"
-                )
-            if plant["Pmax"] < 0:
-                raise ValueError(f"Pmax >= 0 must be satisfied for plant #{i + 1}")
             if "Pmin" not in plant.keys():
                 plant["Pmin"] = 0
-            if plant["Pmin"] < 0 or plant["Pmin"] > plant["Pmax"]:
-                err_msg = f"0 <= Pmin <= Pmax must be satisfied for plant #{i + 1}"
-                raise ValueError(err_msg)
-            if plant["type"] in _renewable_resource:
-                lon = anticipated_bus.loc[plant["bus_id"]].lon
-                lat = anticipated_bus.loc[plant["bus_id"]].lat
-                plant_same_type = self.grid.plant.groupby("type").get_group(
-                    plant["type"]
-                )
-                neighbor_id = find_closest_neighbor(
-                    (lon, lat), plant_same_type[["lon", "lat"]].values
-                )
-                plant["plant_id_neighbor"] = plant_same_type.iloc[neighbor_id].name
-            else:
-                for c in ["0", "1", "2"]:
-                    if "c" + c not in plant.keys():
-                        raise ValueError(f"Missing key c{c} for plant #{i + 1}")
-                    elif plant["c" + c] < 0:
-                        err_msg = f"c{c} >= 0 must be satisfied for plant #{i + 1}"
-                        raise ValueError(err_msg)
-            new_plants.append(plant)
-
-        if "new_plant" not in self.ct:
-            self.ct["new_plant"] = []
-        self.ct["new_plant"] += new_plants
+
+        # Validate the values of all the new plants at once
+        plants = pd.DataFrame(info, columns=["type", "bus_id", "Pmin", "Pmax"])
+        bus_pos = anticipated_bus.index.get_indexer(plants["bus_id"])
+        i = _first_true(bus_pos == -1)
+        if i is not None:
+            raise ValueError(
+                f"No bus id {info[i]['bus_id']} available for plant #{i + 1}"
+            )
+        i = _first_true(plants["Pmax"] < 0)
+        if i is not None:
+            raise ValueError(f"Pmax >= 0 must be satisfied for plant #{i + 1}")
+        i = _first_true((plants["Pmin"] < 0) | (plants["Pmin"] > plants["Pmax"]))
+        if i is not None:
+            err_msg = f"0 <= Pmin <= Pmax must be satisfied for plant #{i + 1}"
+            raise ValueError(err_msg)
+        renewable = plants["type"].isin(_renewable_resource).to_numpy()
+        for c in ["c0", "c1", "c2"]:
+            coefficient = pd.Series([plant.get(c) for plant in info], dtype=float)
+            i = _first_true(~renewable & coefficient.isna())
+            if i is not None:
+                raise ValueError(f"Missing key {c} for plant #{i + 1}")
+            i = _first_true(~renewable & (coefficient < 0))
+            if i is not None:
+                raise ValueError(f"{c} >= 0 must be satisfied for plant #{i + 1}")
+
+        # Find the closest existing plant of the same type for renewable plants
+        for resource, i in plants[renewable].groupby("type").groups.items():
+            i = i.to_numpy()
+            neighbor_id = find_closest_neighbors(
+                np.column_stack([bus_lon[bus_pos[i]], bus_lat[bus_pos[i]]]),
+                self._get_plant_tree(resource),
+            )
+            plant_id = self._get_plant_groups("type")[resource][neighbor_id]
+            for j, p in zip(i, plant_id):
+                info[j]["plant_id_neighbor"] = p
+
+        self._add_new_elements("new_plant", info)
 
     def add_bus(self, info):
         """Sets parameters of new bus(es) in change table.
@@ -739,66 +893,84 @@ class ChangeTable:
             raise TypeError("Argument enclosing new bus(es) must be a list")
 
         info = copy.deepcopy(info)
-        new_buses = []
-        required = {"lat", "lon"}
-        xor_sets = {("zone_id", "zone_name")}
-        defaults = {"Pd": 0, "baseKV": 230}
         for i, new_bus in enumerate(info):
             self._check_entry_keys(
-                new_bus, i, "new_bus", required, xor_sets, defaults.keys()
+                new_bus,
+                i,
+                "new_bus",
+                _new_bus_required,
+                _new_bus_xor_sets,
+                _new_bus_defaults.keys(),
+                _new_bus_allowable,
             )
-            for l in {"lat", "lon"}:
-                if not isinstance(new_bus[l], (int, float)):
-                    raise ValueError(f"{l} must be numeric (int/float)")
-            if abs(new_bus["lat"]) > 90:
-                raise ValueError("'lat' must be between -90 and +90")
-            if abs(new_bus["lon"]) > 180:
-                raise ValueError("'lon' must be between -180 and +180")
-            if "zone_id" in new_bus and new_bus["zone_id"] not in self.grid.id2zone:
-                zone_id = new_bus["zone_id"]
-                raise ValueError(f"zone_id {zone_id} not present in Grid")
+
+        # Validate the values of all the new buses at once
+        for c in ["lat", "lon", "Pd", "baseKV"]:
+            if not all(isinstance(b[c], (int, float)) for b in info if c in b):
+                raise ValueError(f"{c} must be numeric (int/float)")
+        columns = ["lat", "lon", "zone_id", "zone_name", "Pd", "baseKV"]
+        buses = pd.DataFrame(info, columns=columns)
+        if (buses["lat"].abs() > 90).any():
+            raise ValueError("'lat' must be between -90 and +90")
+        if (buses["lon"].abs() > 180).any():
+            raise ValueError("'lon' must be between -180 and +180")
+        if (buses["baseKV"] <= 0).any():
+            raise ValueError("baseKV must be positive")
+        i = _first_true(
+            buses["zone_id"].notna() & ~buses["zone_id"].isin(list(self.grid.id2zone))
+        )
+        if i is not None:
+            raise ValueError(f"zone_id {info[i]['zone_id']} not present in Grid")
+        i = _first_true(
+            buses["zone_name"].notna()
+            & ~buses["zone_name"].isin(list(self.grid.zone2id))
+        )
+        if i is not None:
+            raise ValueError(f"zone_name {info[i]['zone_name']} not present in Grid")
+
+        for new_bus in info:
             if "zone_name" in new_bus:
-                try:
-                    new_bus["zone_id"] = self.grid.zone2id[new_bus["zone_name"]]
-                except KeyError:
-                    zone_name = new_bus["zone_name"]
-                    raise ValueError(f"zone_name {zone_name} not present in Grid")
-                del new_bus["zone_name"]
-            if "Pd" in new_bus:
-                if not isinstance(new_bus["Pd"], (int, float)):
-                    raise ValueError("Pd must be numeric (int/float)")
-            else:
-                new_bus["Pd"] = defaults["Pd"]
-            if "baseKV" in new_bus:
-                if not isinstance(new_bus["baseKV"], (int, float)):
-                    raise ValueError("baseKV must be numeric (int/float)")
-                if new_bus["baseKV"] <= 0:
-                    raise ValueError("baseKV must be positive")
-            else:
-                new_bus["baseKV"] = defaults["baseKV"]
-            new_buses.append(new_bus)
-        if "new_bus" not in self.ct:
-            self.ct["new_bus"] = []
-        self.ct["new_bus"] += new_buses
+                new_bus["zone_id"] = self.grid.zone2id[new_bus.pop("zone_name")]
+            for k, v in _new_bus_defaults.items():
+                new_bus.setdefault(k, v)
+        self._add_new_elements("new_bus", info)
+
+    def _add_new_elements(self, key, entries):
+        """Appends new elements to the change table.
+
+        :param str key: change table key: 'new_branch', 'new_bus', 'new_dcline' or
+            'new_plant'.
+        :param list entries: each entry is a dictionary describing a new element.
+        """
+        self.ct.setdefault(key, []).extend(_intern_keys(entries))
+        self._new_element_revision += 1
 
     def _get_df_with_new_elements(self, table):
-        """Get a post-transformation data table, for use with adding elements at new
-        buses, or scaling new elements.
+        """Get a data table of the grid with the new elements of the change table
+        added, for use with adding elements at new buses, or scaling new elements.
+        No scaling from the change table is applied to the table.
 
         :param str table: the table of the grid to be fetched:
             'branch', 'bus', 'dcline', or 'plant'.
-        :return: (*pandas.DataFrame*) -- the post-transformation table.
+        :return: (*pandas.DataFrame*) -- the table with the new elements.
         """
-        add_key = f"new_{table}"
-        if add_key not in self.ct:
+        if f"new_{table}" not in self.ct:
             return getattr(self.grid, table)
-        new_elements_tuple = tuple(tuple(sorted(b.items())) for b in self.ct[add_key])
-        if new_elements_tuple in self._new_element_caches[table]:
-            return self._new_element_caches[table][new_elements_tuple]
-        else:
-            transformed = getattr(TransformGrid(self.grid, self.ct).get_grid(), table)
-            self._new_element_caches[table][new_elements_tuple] = transformed
-            return transformed.copy()
+        # The revision is bumped by every method adding or clearing new elements,
+        # the list ids and lengths catch lists replaced or extended directly in ct.
+        # Entries edited in place are not detected.
+        additions = {k: self.ct[k] for k in _new_element_keys if k in self.ct}
+        key = (self._new_element_revision,) + tuple(
+            (k, id(v), len(v)) for k, v in additions.items()
+        )
+        if table in self._new_element_tables:
+            last_key, _, last_table = self._new_element_tables[table]
+            if last_key == key:
+                return last_table
+        transformed = getattr(TransformGrid(self.grid, additions).get_grid(), table)
+        # The lists are kept so that their ids cannot be reused while cached
+        self._new_element_tables[table] = (key, list(additions.values()), transformed)
+        return transformed
 
     def write(self, scenario_id):
         """Saves change table to disk.
@@ -811,6 +983,7 @@ class ChangeTable:
         file_name = os.path.join(server_setup.LOCAL_DIR, scenario_id + "_ct.pkl")
         if os.path.isfile(file_name) is False:
             print("Writing %s" % file_name)
-            pickle.dump(self.ct, open(file_name, "wb"))
+            with open(file_name, "wb") as f:
+                pickle.dump(self.ct, f, protocol=pickle.HIGHEST_PROTOCOL)
         else:
             raise IOError("%s already exists" % file_name)
@@ -1,6 +1,7 @@
 import os
 from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
 from powersimdata.input.check import (
@@ -32,8 +33,10 @@ def add_column_to_data_frame(data_frame, column_dict):
     :param dict column_dict: column to be added. Keys are column name and
         values a list of of values.
     """
-    for key, value in column_dict.items():
-        data_frame[key] = value
+    if column_dict:
+        data_frame[list(column_dict)] = pd.DataFrame(
+            {k: np.asarray(v) for k, v in column_dict.items()}, index=data_frame.index
+        )
 
 
 def add_coord_to_grid_data_frames(grid):
@@ -42,18 +45,14 @@ def add_coord_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2coord = (
-        pd.merge(grid.bus2sub[["sub_id"]], grid.sub[["lat", "lon"]], on="sub_id")
-        .set_index(grid.bus2sub.index)
-        .drop(columns="sub_id")
-        .to_dict()
-    )
+    bus2coord = grid.sub[["lat", "lon"]].loc[grid.bus2sub.sub_id]
+    bus2coord.index = grid.bus2sub.index
 
     def get_lat(idx):
-        return [bus2coord["lat"][i] for i in idx]
+        return bus2coord["lat"].loc[idx].to_numpy()
 
     def get_lon(idx):
-        return [bus2coord["lon"][i] for i in idx]
+        return bus2coord["lon"].loc[idx].to_numpy()
 
     extra_col_bus = {"lat": get_lat(grid.bus.index), "lon": get_lon(grid.bus.index)}
     add_column_to_data_frame(grid.bus, extra_col_bus)
@@ -78,13 +77,14 @@ def add_zone_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2zone = grid.bus.zone_id.to_dict()
+    bus2zone = grid.bus.zone_id
+    id2zone = pd.Series(grid.id2zone)
 
     def get_zone_id(idx):
-        return [bus2zone[i] for i in idx]
+        return bus2zone.loc[idx].to_numpy()
 
     def get_zone_name(idx):
-        return [grid.id2zone[bus2zone[i]] for i in idx]
+        return id2zone.loc[bus2zone.loc[idx]].to_numpy()
 
     extra_col_plant = {
         "zone_id": get_zone_id(grid.plant.bus_id),
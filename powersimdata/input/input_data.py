@@ -1,5 +1,8 @@
 import os
+from importlib.util import find_spec
+from tempfile import mkstemp
 
+import numpy as np
 import pandas as pd
 
 from powersimdata.data_access.context import Context
@@ -7,10 +10,15 @@ from powersimdata.data_access.profile_helper import ProfileHelper
 from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import MemoryCache, cache_key
 
-_cache = MemoryCache()
+_cache = MemoryCache(max_size=8)
 
 profile_kind = {"demand", "hydro", "solar", "wind"}
 
+_has_pyarrow = find_spec("pyarrow") is not None
+# The pyarrow engine of read_csv was added in pandas 1.4
+_pandas_version = tuple(int(v) for v in pd.__version__.split(".")[:2])
+_has_pyarrow_csv_engine = _has_pyarrow and _pandas_version >= (1, 4)
+
 
 _file_extension = {
     **{"ct": "pkl", "grid": "mat"},
@@ -52,9 +60,8 @@ def _check_field(field_name):
     :raises ValueError: if not *'demand'*, *'hydro'*, *'solar'*, *'wind'*
         *'ct'* or *'grid'*.
     """
-    possible = list(_file_extension.keys())
-    if field_name not in possible:
-        raise ValueError("Only %s data can be loaded" % " | ".join(possible))
+    if field_name not in _file_extension:
+        raise ValueError("Only %s data can be loaded" % " | ".join(_file_extension))
 
 
 class InputData:
@@ -65,9 +72,21 @@ class InputData:
 
     def __init__(self, data_loc=None):
         """Constructor."""
-        os.makedirs(server_setup.LOCAL_DIR, exist_ok=True)
+        self.data_loc = data_loc
+        self._data_access = None
+
+    @property
+    def data_access(self):
+        """Returns the data access instance, fetched on first use since most data is
+        read from the local directory. The local directory is created by the data
+        access or profile helper when a file is downloaded.
 
-        self.data_access = Context.get_data_access(data_loc)
+        :return: (:class:`powersimdata.data_access.data_access.DataAccess`) -- a data
+            access instance shared with the other users of the same data location.
+        """
+        if self._data_access is None:
+            self._data_access = Context.get_data_access(self.data_loc)
+        return self._data_access
 
     def get_data(self, scenario_info, field_name):
         """Returns data either from server or local directory.
@@ -125,16 +144,17 @@ def _read_data(filepath):
         wind as a data frame, change table as a dict, or str containing a
         local path to a matfile of grid data.
     :raises ValueError: if extension is unknown.
+    :raises FileNotFoundError: if file not found on local machine.
     """
     ext = os.path.basename(filepath).split(".")[-1]
     if ext == "pkl":
         data = pd.read_pickle(filepath)
     elif ext == "csv":
-        data = pd.read_csv(filepath, index_col=0, parse_dates=True)
-        data.columns = data.columns.astype(int)
+        data = _read_profile(filepath)
     elif ext == "mat":
-        # Try to load the matfile, just to check if it exists locally
-        open(filepath, "r")
+        # Check that the matfile exists locally, it is loaded later on
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(filepath)
         data = filepath
     else:
         raise ValueError("Unknown extension! %s" % ext)
@@ -142,6 +162,75 @@ def _read_data(filepath):
     return data
 
 
+def _read_profile(filepath):
+    """Reads a profile from a csv file. If pyarrow is installed, the csv file is
+    parsed with the pyarrow engine (pandas >= 1.4) and the parsed profile is saved
+    next to the csv file as a parquet file, which is read instead as long as the csv
+    file has not been modified since.
+
+    :param str filepath: path to the csv file.
+    :return: (*pandas.DataFrame*) -- profile as a data frame.
+    """
+    data = _read_profile_cache(filepath)
+    if data is None:
+        # The pyarrow engine parses the file with multiple threads
+        data = pd.read_csv(
+            filepath,
+            index_col=0,
+            parse_dates=True,
+            engine="pyarrow" if _has_pyarrow_csv_engine else "c",
+        )
+        # Parquet requires string column names
+        data.columns = data.columns.astype(str)
+        _write_profile_cache(filepath, data)
+    data.columns = data.columns.astype(int)
+
+    return data
+
+
+def _read_profile_cache(filepath):
+    """Reads the parquet copy of a profile, if it is newer than the csv file.
+
+    :param str filepath: path to the csv file.
+    :return: (*pandas.DataFrame*) -- profile as a data frame. None if pyarrow is not
+        installed or the copy is missing, outdated or cannot be read.
+    """
+    parquet_path = filepath + ".parquet"
+    if not _has_pyarrow:
+        return None
+    try:
+        if os.stat(parquet_path).st_mtime_ns <= os.stat(filepath).st_mtime_ns:
+            return None
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    except (OSError, ValueError):
+        # Fall back to the csv file if the copy is missing or corrupted
+        return None
+
+
+def _write_profile_cache(filepath, data):
+    """Writes a parquet copy of a profile next to the csv file. The copy is written
+    to a temporary file first and then moved into place, so that a concurrent reader
+    never sees a partially written file. Nothing is written if pyarrow is not
+    installed or the directory is not writable.
+
+    :param str filepath: path to the csv file.
+    :param pandas.DataFrame data: profile with string column names.
+    """
+    if not _has_pyarrow:
+        return
+    try:
+        tmp_file, tmp_path = mkstemp(dir=os.path.dirname(filepath), suffix=".tmp")
+        os.close(tmp_file)
+        try:
+            data.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+            os.replace(tmp_path, filepath + ".parquet")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        pass
+
+
 def get_bus_demand(scenario_info, grid):
     """Returns demand profiles by bus.
 
@@ -149,13 +238,20 @@ def get_bus_demand(scenario_info, grid):
     :param powersimdata.input.grid.Grid grid: grid to construct bus demand for.
     :return: (*pandas.DataFrame*) -- data frame of demand.
     """
-    bus = grid.bus.copy()
+    bus = grid.bus
     demand = InputData().get_data(scenario_info, "demand")[bus.zone_id.unique()]
-    bus["zone_Pd"] = bus.groupby("zone_id")["Pd"].transform("sum")
-    bus["zone_share"] = bus["Pd"] / bus["zone_Pd"]
-    zone_bus_shares = pd.DataFrame(
-        {z: bus.groupby("zone_id").get_group(z).zone_share for z in demand.columns}
-    ).fillna(0)
-    bus_demand = demand.dot(zone_bus_shares.T)
+    zone_id = bus["zone_id"].to_numpy()
+    zone_idx = demand.columns.get_indexer(zone_id)
+    bus_pd = bus["Pd"].to_numpy()
+    zone_pd = np.bincount(zone_idx, weights=bus_pd, minlength=len(demand.columns))
+    with np.errstate(invalid="ignore"):
+        zone_share = np.nan_to_num(bus_pd / zone_pd[zone_idx])
+    # Each bus belongs to a single zone, so the product of the demand with the zone to
+    # bus share matrix reduces to scaling the demand of the zone of each bus
+    bus_demand = pd.DataFrame(
+        demand.to_numpy()[:, zone_idx] * zone_share,
+        index=demand.index,
+        columns=bus.index,
+    )
 
     return bus_demand
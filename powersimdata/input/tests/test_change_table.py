@@ -358,6 +358,17 @@ def test_add_plant_neighbor_can_be_on_same_bus(ct):
     assert hydro_neighbor_id == hydro_plant.iloc[2000].name
 
 
+def test_plant_groups_are_cached(ct):
+    maine_ng = grid.plant.query("zone_name == 'Maine' & type == 'ng'").index
+    assert ct._get_plant_id("Maine", "ng") == maine_ng.tolist()
+    assert ct._get_plant_id("Maine", "unknown") == []
+    assert ct._get_plant_groups(["zone_name", "type"]) is ct._get_plant_groups(
+        ["zone_name", "type"]
+    )
+    ct.grid = grid
+    assert ct._plant_groups == {}
+
+
 def test_scale_pmin_by_plant_too_high(ct):
     ct.scale_plant_pmin("ng", plant_id={0: 100})
     assert ct.ct["ng_pmin"]["plant_id"][0] * grid.plant.loc[0, "Pmin"] == pytest.approx(
@@ -383,6 +394,18 @@ def test_scale_pmin_by_plant_and_zone_too_high(ct):
     ) == pytest.approx(grid.plant.loc[0, "Pmax"])
 
 
+def test_scale_pmin_after_adding_plant(ct):
+    bus_id = int(grid.plant.loc[grid.plant.type == "ng", "bus_id"].iloc[0])
+    new_plant = {"type": "ng", "bus_id": bus_id, "Pmin": 50, "Pmax": 100}
+    ct.add_plant([{**new_plant, "c0": 1, "c1": 1, "c2": 1}])
+    ct.scale_plant_pmin("ng", zone_name={"Washington": 1.6})
+    assert "plant_id" not in ct.ct["ng_pmin"]
+
+    new_plant_id = grid.plant.index[-1] + 1
+    ct.scale_plant_pmin("ng", plant_id={new_plant_id: 3})
+    assert ct.ct["ng_pmin"]["plant_id"][new_plant_id] == pytest.approx(2)
+
+
 def test_add_bus_success(ct):
     new_buses = [
         {"lat": 40, "lon": 50.5, "zone_id": 2, "baseKV": 69},
@@ -436,6 +459,40 @@ def test_add_new_elements_at_new_buses(ct):
     ct.add_plant([{"type": "wind", "bus_id": new_bus2, "Pmax": 400}])
 
 
+def test_anticipated_bus_is_reused_until_new_bus_is_added(ct):
+    assert ct._get_df_with_new_elements("bus") is grid.bus
+    ct.add_bus([{"lat": 40, "lon": 50.5, "zone_id": 2}])
+    anticipated_bus = ct._get_df_with_new_elements("bus")
+    assert len(anticipated_bus) == len(grid.bus) + 1
+    assert ct._get_df_with_new_elements("bus") is anticipated_bus
+    ct.add_bus([{"lat": -40.5, "lon": -50, "zone_id": 2}])
+    assert len(ct._get_df_with_new_elements("bus")) == len(grid.bus) + 2
+    ct.clear()
+    assert ct._get_df_with_new_elements("bus") is grid.bus
+
+
+def test_anticipated_bus_is_rebuilt_after_clear(ct):
+    ct.add_bus([{"lat": 40, "lon": 50.5, "zone_id": 2}])
+    anticipated_bus = ct._get_df_with_new_elements("bus")
+    ct.ct["new_bus"][0] = {**ct.ct["new_bus"][0], "lat": -40.5}
+    ct.clear("dcline")
+    assert ct._get_df_with_new_elements("bus") is not anticipated_bus
+    assert ct._get_df_with_new_elements("bus").lat.iloc[-1] == -40.5
+
+
+def test_anticipated_plant_is_not_scaled(ct):
+    bus_id = int(grid.plant.loc[grid.plant.type == "ng", "bus_id"].iloc[0])
+    new_plant = {"type": "ng", "bus_id": bus_id, "Pmax": 100}
+    ct.add_plant([{**new_plant, "c0": 1, "c1": 1, "c2": 1}])
+    ct.scale_plant_capacity("ng", plant_id={0: 2})
+    anticipated_plant = ct._get_df_with_new_elements("plant")
+    assert anticipated_plant.loc[0, "Pmax"] == grid.plant.loc[0, "Pmax"]
+    assert len(anticipated_plant) == len(grid.plant) + 1
+
+    ct.ct["new_plant"].append(dict(ct.ct["new_plant"][0]))
+    assert len(ct._get_df_with_new_elements("plant")) == len(grid.plant) + 2
+
+
 def test_change_table_clear_success(ct):
     fake_scaling = {"demand", "branch", "solar", "ng_cost", "coal_pmin", "dcline"}
     fake_additions = {"storage", "new_dcline", "new_branch", "new_plant"}
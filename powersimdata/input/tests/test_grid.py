@@ -30,6 +30,13 @@ def test_add_column_to_data_frame():
     assert np.array_equal(df.c.values, [True, True, False])
 
 
+def test_add_column_to_data_frame_with_series():
+    df = pd.DataFrame({"a": [1, 2, 3]}, index=[10, 11, 12])
+    column_to_add = {"b": pd.Series([4, 5, 6], index=[0, 1, 2])}
+    add_column_to_data_frame(df, column_to_add)
+    assert np.array_equal(df.b.values, [4, 5, 6])
+
+
 def test_grid_type():
     g = Grid(["USA"])
     assert isinstance(g, Grid)
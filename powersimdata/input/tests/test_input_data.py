@@ -1,6 +1,11 @@
+import os
+
+import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
-from powersimdata.input.input_data import InputHelper, _check_field
+from powersimdata.input import input_data
+from powersimdata.input.input_data import InputHelper, _check_field, _read_data
 
 
 def test_get_file_components():
@@ -18,3 +23,49 @@ def test_check_field():
     with pytest.raises(ValueError):
         _check_field("foo")
         _check_field("coal")
+
+
+def test_read_data_profile_is_cached_as_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    profile = pd.DataFrame(
+        {101: [1.0, 2.5], 102: [3.0, 4.0]},
+        index=pd.date_range("2016-01-01", periods=2, freq="H", name="UTC"),
+    )
+    filepath = str(tmp_path / "1_demand.csv")
+    profile.to_csv(filepath)
+
+    assert_frame_equal(_read_data(filepath), profile, check_freq=False)
+    assert os.path.isfile(filepath + ".parquet")
+    assert_frame_equal(_read_data(filepath), profile, check_freq=False)
+
+
+def test_read_data_profile_with_corrupted_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    profile = pd.DataFrame(
+        {101: [1.0, 2.5]},
+        index=pd.date_range("2016-01-01", periods=2, freq="H", name="UTC"),
+    )
+    filepath = str(tmp_path / "1_demand.csv")
+    profile.to_csv(filepath)
+    with open(filepath + ".parquet", "wb") as f:
+        f.write(b"truncated")
+    assert_frame_equal(_read_data(filepath), profile, check_freq=False)
+    assert_frame_equal(_read_data(filepath), profile, check_freq=False)
+    assert [f for f in os.listdir(tmp_path) if f.endswith(".tmp")] == []
+
+
+def test_read_data_profile_without_pyarrow_csv_engine(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(input_data, "_has_pyarrow_csv_engine", False)
+    profile = pd.DataFrame(
+        {101: [1.0, 2.5]},
+        index=pd.date_range("2016-01-01", periods=2, freq="H", name="UTC"),
+    )
+    filepath = str(tmp_path / "1_demand.csv")
+    profile.to_csv(filepath)
+    assert_frame_equal(_read_data(filepath), profile, check_freq=False)
+
+
+def test_read_data_missing_matfile(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        _read_data(str(tmp_path / "1_grid.mat"))
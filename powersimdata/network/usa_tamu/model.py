@@ -1,4 +1,11 @@
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from tempfile import mkstemp
+
+import pandas as pd
 
 from powersimdata.input.abstract_grid import AbstractGrid
 from powersimdata.input.helpers import (
@@ -6,8 +13,8 @@ from powersimdata.input.helpers import (
     add_zone_to_grid_data_frames,
     csv_to_data_frame,
 )
-from powersimdata.network.csv_reader import CSVReader
 from powersimdata.network.usa_tamu.constants.storage import defaults
+from powersimdata.utility import server_setup
 
 
 class TAMU(AbstractGrid):
@@ -38,12 +45,12 @@ class TAMU(AbstractGrid):
 
     def _build_network(self):
         """Build network."""
-        reader = CSVReader(self.data_loc)
-        self.bus = reader.bus
-        self.plant = reader.plant
-        self.branch = reader.branch
-        self.dcline = reader.dcline
-        self.gencost["after"] = self.gencost["before"] = reader.gencost
+        tables = _load_tamu_tables(self.data_loc)
+        self.bus = tables["bus"].copy()
+        self.plant = tables["plant"].copy()
+        self.branch = tables["branch"].copy()
+        self.dcline = tables["dcline"].copy()
+        self.gencost["after"] = self.gencost["before"] = tables["gencost"].copy()
 
         self.storage.update(defaults)
 
@@ -57,23 +64,127 @@ class TAMU(AbstractGrid):
         defined interconnect(s).
 
         """
-        for key, value in self.__dict__.items():
-            if key in ["sub", "bus2sub", "bus", "plant", "branch"]:
-                value.query("interconnect == @self.interconnect", inplace=True)
-            elif key == "gencost":
-                value["before"].query(
-                    "interconnect == @self.interconnect", inplace=True
-                )
-            elif key == "dcline":
-                value.query(
-                    "from_interconnect == @self.interconnect &"
-                    "to_interconnect == @self.interconnect",
-                    inplace=True,
-                )
+        for key in ["sub", "bus2sub", "bus", "plant", "branch"]:
+            value = getattr(self, key)
+            setattr(self, key, value[value.interconnect.isin(self.interconnect)].copy())
+        gencost = self.gencost["before"]
+        self.gencost["after"] = self.gencost["before"] = gencost[
+            gencost.interconnect.isin(self.interconnect)
+        ].copy()
+        dcline = self.dcline
+        self.dcline = dcline[
+            dcline.from_interconnect.isin(self.interconnect)
+            & dcline.to_interconnect.isin(self.interconnect)
+        ].copy()
         self.id2zone = {k: self.id2zone[k] for k in self.bus.zone_id.unique()}
         self.zone2id = {value: key for key, value in self.id2zone.items()}
 
 
+_table_names = ("bus", "plant", "branch", "dcline", "gencost", "sub", "bus2sub", "zone")
+_interconnect_columns = ("interconnect", "from_interconnect", "to_interconnect")
+_interconnect_dtype = pd.CategoricalDtype(["Eastern", "Texas", "Western"])
+
+
+@lru_cache(maxsize=4)
+def _load_tamu_tables(data_loc):
+    """Reads the TAMU network files once per data location. The returned data frames
+    are shared between calls and must be copied before being modified.
+
+    :param str data_loc: path to data.
+    :return: (*dict*) -- data frames of the network, keyed by table name, and
+        the zone id to zone name mapping, keyed by *'id2zone'*. Interconnect columns
+        are categorical.
+    """
+    tables = _read_table_cache(data_loc)
+    if tables is None:
+        # The files are independent and the csv parser releases the GIL
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            data_frames = executor.map(
+                lambda n: csv_to_data_frame(data_loc, f"{n}.csv"), _table_names
+            )
+            tables = dict(zip(_table_names, data_frames))
+        _write_table_cache(data_loc, tables)
+    for data_frame in tables.values():
+        for column in data_frame.columns.intersection(_interconnect_columns):
+            data_frame[column] = data_frame[column].astype(_interconnect_dtype)
+    tables["id2zone"] = tables.pop("zone").zone_name.to_dict()
+    return tables
+
+
+def _table_cache_dir(data_loc):
+    """Returns the directory of the parquet copies of the TAMU network files. It is
+    located in the user's local directory, in a folder specific to the data location.
+
+    :param str data_loc: path to data.
+    :return: (*str*) -- path to the cache directory.
+    """
+    key = hashlib.sha1(os.path.abspath(data_loc).encode()).hexdigest()[:16]
+    return os.path.join(server_setup.LOCAL_DIR, "cache", "usa_tamu", key)
+
+
+def _read_table_cache(data_loc):
+    """Reads the parquet copies of the TAMU network files, if they are newer than all
+    the csv files.
+
+    :param str data_loc: path to data.
+    :return: (*dict*) -- data frames keyed by table name. None if pyarrow is not
+        installed or the cache is missing, outdated or cannot be read.
+    """
+    cache_dir = _table_cache_dir(data_loc)
+    if find_spec("pyarrow") is None or not os.path.isdir(cache_dir):
+        return None
+    try:
+        cache_mtime = min(
+            os.stat(os.path.join(cache_dir, f"{n}.parquet")).st_mtime_ns
+            for n in _table_names
+        )
+        csv_mtime = max(
+            os.stat(os.path.join(data_loc, f"{n}.csv")).st_mtime_ns
+            for n in _table_names
+        )
+        if cache_mtime <= csv_mtime:
+            return None
+        return {
+            n: pd.read_parquet(
+                os.path.join(cache_dir, f"{n}.parquet"), engine="pyarrow"
+            )
+            for n in _table_names
+        }
+    except (OSError, ValueError):
+        # Fall back to the csv files if any copy is missing or corrupted
+        return None
+
+
+def _write_table_cache(data_loc, tables):
+    """Writes parquet copies of the TAMU network files. Each file is written to a
+    temporary file first and then moved into place, so that a concurrent reader
+    never sees a partially written file. Nothing is written if pyarrow is not
+    installed or the cache directory is not writable.
+
+    :param str data_loc: path to data.
+    :param dict tables: data frames keyed by table name.
+    """
+    if find_spec("pyarrow") is None:
+        return
+    cache_dir = _table_cache_dir(data_loc)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name, data_frame in tables.items():
+            tmp_file, tmp_path = mkstemp(dir=cache_dir, suffix=".tmp")
+            os.close(tmp_file)
+            try:
+                data_frame.to_parquet(tmp_path, engine="pyarrow")
+                os.replace(tmp_path, os.path.join(cache_dir, f"{name}.parquet"))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    except OSError:
+        pass
+
+
+_possible_interconnects = frozenset({"Eastern", "Texas", "Western", "USA"})
+
+
 def check_and_format_interconnect(interconnect):
     """Checks interconnect.
 
@@ -90,9 +201,11 @@ def check_and_format_interconnect(interconnect):
     except:  # noqa
         raise TypeError("interconnect must be either str or an iterable of str")
 
-    possible = ["Eastern", "Texas", "Western", "USA"]
-    if any(i for i in interconnect if i not in possible):
-        raise ValueError("Wrong interconnect. Choose from %s" % " | ".join(possible))
+    if not _possible_interconnects.issuperset(interconnect):
+        raise ValueError(
+            "Wrong interconnect. Choose from %s"
+            % " | ".join(sorted(_possible_interconnects))
+        )
     n = len(interconnect)
     if "USA" in interconnect and n > 1:
         raise ValueError("USA cannot be paired")
@@ -103,11 +216,12 @@ def check_and_format_interconnect(interconnect):
 
 
 def interconnect_to_name(interconnect):
-    """Return name of interconnect or collection of interconnects..
+    """Return name of interconnect or collection of interconnects.
 
-    :param list interconnect: interconnect name(s).
+    :param str/iterable interconnect: interconnect name(s).
+    :return: (*str*) -- name of the interconnect(s), in alphabetical order.
     """
-    return "_".join(sorted(check_and_format_interconnect(interconnect)))
+    return "_".join(check_and_format_interconnect(interconnect))
 
 
 def add_information_to_model(model):
@@ -115,9 +229,10 @@ def add_information_to_model(model):
 
     :param powersimdata.input.TAMU model: TAMU instance.
     """
-    model.sub = csv_to_data_frame(model.data_loc, "sub.csv")
-    model.bus2sub = csv_to_data_frame(model.data_loc, "bus2sub.csv")
-    model.id2zone = csv_to_data_frame(model.data_loc, "zone.csv").zone_name.to_dict()
+    tables = _load_tamu_tables(model.data_loc)
+    model.sub = tables["sub"].copy()
+    model.bus2sub = tables["bus2sub"].copy()
+    model.id2zone = tables["id2zone"].copy()
     model.zone2id = {v: k for k, v in model.id2zone.items()}
 
     add_zone_to_grid_data_frames(model)
@@ -1,6 +1,17 @@
+import os
+
 import pytest
+from pandas.testing import assert_frame_equal
 
-from powersimdata.network.usa_tamu.model import TAMU, check_and_format_interconnect
+from powersimdata.network.usa_tamu.model import (
+    TAMU,
+    _load_tamu_tables,
+    _read_table_cache,
+    _table_cache_dir,
+    check_and_format_interconnect,
+    interconnect_to_name,
+)
+from powersimdata.utility import server_setup
 
 
 def _assert_lists_equal(a, b):
@@ -46,6 +57,14 @@ def test_interconnect():
         _assert_lists_equal(check_and_format_interconnect(a), e)
 
 
+def test_interconnect_to_name():
+    assert interconnect_to_name("USA") == "USA"
+    assert interconnect_to_name(["Western", "Texas"]) == "Texas_Western"
+    assert interconnect_to_name({"Texas", "Western", "Texas"}) == "Texas_Western"
+    with pytest.raises(ValueError, match="Use USA instead"):
+        interconnect_to_name(["Western", "Texas", "Eastern"])
+
+
 def _assert_interconnect_missing(interconnect, model):
     assert interconnect not in model.sub.interconnect.unique()
     assert interconnect not in model.bus2sub.interconnect.unique()
@@ -69,3 +88,32 @@ def test_drop_two_interconnect():
     _assert_lists_equal(["Western"], model.interconnect)
     for interconnect in ["Eastern", "Texas"]:
         _assert_interconnect_missing(interconnect, model)
+
+
+def test_cached_tables_are_not_modified():
+    TAMU(["Texas"])
+    model = TAMU(["USA"])
+    for interconnect in ["Eastern", "Texas", "Western"]:
+        assert interconnect in model.bus.interconnect.unique()
+        assert interconnect in model.sub.interconnect.unique()
+
+
+def test_tables_are_cached_as_parquet(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    data_loc = os.path.join(os.path.dirname(__file__), "..", "data")
+    cache_dir = _table_cache_dir(data_loc)
+    assert cache_dir.startswith(str(tmp_path))
+
+    from_csv = _load_tamu_tables.__wrapped__(data_loc)
+    assert os.path.isfile(os.path.join(cache_dir, "bus.parquet"))
+    assert [f for f in os.listdir(cache_dir) if f.endswith(".tmp")] == []
+    from_cache = _load_tamu_tables.__wrapped__(data_loc)
+    assert from_cache["id2zone"] == from_csv["id2zone"]
+    for name in ["bus", "plant", "branch", "dcline", "gencost", "sub", "bus2sub"]:
+        assert_frame_equal(from_cache[name], from_csv[name])
+
+    with open(os.path.join(cache_dir, "bus.parquet"), "wb") as f:
+        f.write(b"truncated")
+    assert _read_table_cache(data_loc) is None
+    assert_frame_equal(_load_tamu_tables.__wrapped__(data_loc)["bus"], from_csv["bus"])
@@ -1,8 +1,9 @@
 import copy
 import pickle
+import time
 import warnings
+import weakref
 
-import numpy as np
 import pandas as pd
 
 from powersimdata.input.change_table import ChangeTable
@@ -15,6 +16,48 @@ from powersimdata.scenario.execute import Execute
 from powersimdata.scenario.state import State
 from powersimdata.utility import server_setup
 
+_required_info = (
+    "plan",
+    "name",
+    "grid_model",
+    "interconnect",
+    "base_demand",
+    "base_hydro",
+    "base_solar",
+    "base_wind",
+    "start_date",
+    "end_date",
+    "interval",
+    "engine",
+)
+_scenario_table_ttl = 60  # seconds
+# Scenario tables already fetched, keyed by id of the data access object
+_scenario_tables = {}
+
+
+def _get_scenario_table(scenario_list_manager, refresh=False):
+    """Returns the scenario table, reusing the table fetched through the same data
+    access if it is less than ``_scenario_table_ttl`` seconds old.
+
+    :param powersimdata.data_access.scenario_list.ScenarioListManager
+        scenario_list_manager: scenario list manager.
+    :param bool refresh: fetch the table even if a recent one is available.
+    :return: (*pandas.DataFrame*) -- scenario list as a data frame.
+    """
+    data_access = scenario_list_manager.data_access
+    key = id(data_access)
+    now = time.monotonic()
+    if key in _scenario_tables:
+        fetched, table = _scenario_tables[key]
+        if not refresh and now - fetched < _scenario_table_ttl:
+            return table
+    else:
+        # Drop the cached table once the data access object is garbage collected
+        weakref.finalize(data_access, _scenario_tables.pop, key, None)
+    table = scenario_list_manager.get_scenario_table()
+    _scenario_tables[key] = (now, table)
+    return table
+
 
 class Create(State):
     """Scenario is in a state of being created.
@@ -55,30 +98,37 @@ class Create(State):
         super().__setattr__(name, value)
 
     def _update_scenario_info(self):
-        """Updates scenario information."""
+        """Updates scenario information. Builder fields are only copied if the
+        builder has been modified since the last update.
+        """
         if self.builder is not None:
-            self._scenario_info["plan"] = self.builder.plan_name
-            self._scenario_info["name"] = self.builder.scenario_name
-            self._scenario_info["start_date"] = self.builder.start_date
-            self._scenario_info["end_date"] = self.builder.end_date
-            self._scenario_info["interval"] = self.builder.interval
-            self._scenario_info["base_demand"] = self.builder.demand
-            self._scenario_info["base_hydro"] = self.builder.hydro
-            self._scenario_info["base_solar"] = self.builder.solar
-            self._scenario_info["base_wind"] = self.builder.wind
-            self._scenario_info["engine"] = self.builder.engine
-            if bool(self.builder.change_table.ct):
-                self._scenario_info["change_table"] = "Yes"
-            else:
-                self._scenario_info["change_table"] = "No"
+            builder = self.builder
+            if builder._dirty:
+                self._scenario_info.update(
+                    plan=builder.plan_name,
+                    name=builder.scenario_name,
+                    start_date=builder.start_date,
+                    end_date=builder.end_date,
+                    interval=builder.interval,
+                    base_demand=builder.demand,
+                    base_hydro=builder.hydro,
+                    base_solar=builder.solar,
+                    base_wind=builder.wind,
+                    engine=builder.engine,
+                )
+                builder._dirty = False
+            # the change table is edited in place, so its status is always checked
+            self._scenario_info["change_table"] = (
+                "Yes" if builder.change_table.ct else "No"
+            )
 
     def _upload_change_table(self):
         """Uploads change table to server."""
-        print("--> Writing change table on local machine")
-        self.builder.change_table.write(self._scenario_info["id"])
         file_name = self._scenario_info["id"] + "_ct.pkl"
         input_dir = self._data_access.join(*server_setup.INPUT_DIR)
-        self._data_access.move_to(file_name, input_dir)
+        self._data_access.write_pickle(
+            self.builder.change_table.ct, file_name, input_dir
+        )
 
     def get_bus_demand(self):
         """Returns demand profiles, by bus.
@@ -92,10 +142,7 @@ class Create(State):
     def create_scenario(self):
         """Creates scenario."""
         self._update_scenario_info()
-        missing = []
-        for key, val in self._scenario_info.items():
-            if not val:
-                missing.append(key)
+        missing = [k for k in _required_info if not self._scenario_info[k]]
         if len(missing) != 0:
             print("-------------------")
             print("MISSING INFORMATION")
@@ -110,13 +157,12 @@ class Create(State):
             )
 
             # Add missing information
-            self._scenario_info["state"] = "execute"
-            self._scenario_info["runtime"] = ""
-            self._scenario_info["infeasibilities"] = ""
+            self._scenario_info.update(state="execute", runtime="", infeasibilities="")
             self.grid = self.builder.get_grid()
             self.ct = self.builder.change_table.ct
             # Add to scenario list and set the id in scenario_info
             self._scenario_list_manager.add_entry(self._scenario_info)
+            _scenario_tables.pop(id(self._data_access), None)
 
             if bool(self.builder.change_table.ct):
                 self._upload_change_table()
@@ -136,15 +182,16 @@ class Create(State):
         )
         self.set_grid(*args, **kwargs)
 
-    def set_grid(self, grid_model="usa_tamu", interconnect="USA"):
+    def set_grid(self, grid_model="usa_tamu", interconnect="USA", refresh=False):
         """Sets grid builder.
 
         :param str grid_model: name of grid model. Default is *'usa_tamu'*.
         :param str/list interconnect: name of interconnect(s). Default is *'USA'*.
+        :param bool refresh: fetch the scenario list again even if it was fetched
+            less than a minute ago, e.g. to see scenarios just created by others.
         """
-        self.builder = _Builder(
-            grid_model, interconnect, self._scenario_list_manager.get_scenario_table()
-        )
+        table = _get_scenario_table(self._scenario_list_manager, refresh=refresh)
+        self.builder = _Builder(grid_model, interconnect, table)
         self.exported_methods |= _Builder.exported_methods
 
         print("--> Summary")
@@ -177,16 +224,26 @@ class _Builder:
     :param pandas.DataFrame table: scenario list table
     """
 
-    plan_name = ""
-    scenario_name = ""
-    start_date = "2016-01-01 00:00:00"
-    end_date = "2016-12-31 23:00:00"
-    interval = "24H"
-    demand = ""
-    hydro = ""
-    solar = ""
-    wind = ""
-    engine = "REISE.jl"
+    __slots__ = (
+        "grid_model",
+        "interconnect",
+        "base_grid",
+        "change_table",
+        "existing",
+        "plan_name",
+        "scenario_name",
+        "start_date",
+        "end_date",
+        "interval",
+        "demand",
+        "hydro",
+        "solar",
+        "wind",
+        "engine",
+        "_existing_names",
+        "_profile_versions",
+        "_dirty",
+    )
     exported_methods = {
         "set_base_profile",
         "set_engine",
@@ -213,6 +270,20 @@ class _Builder:
         self.change_table = ChangeTable(self.base_grid)
 
         self.existing = table[table.interconnect == self.interconnect]
+        self._existing_names = set(zip(self.existing.plan, self.existing.name))
+        self._profile_versions = {}
+
+        self.plan_name = ""
+        self.scenario_name = ""
+        self.start_date = "2016-01-01 00:00:00"
+        self.end_date = "2016-12-31 23:00:00"
+        self.interval = "24H"
+        self.demand = ""
+        self.hydro = ""
+        self.solar = ""
+        self.wind = ""
+        self.engine = "REISE.jl"
+        self._dirty = True
 
     def get_ct(self):
         """Returns change table.
@@ -275,15 +346,13 @@ class _Builder:
         :param str scenario_name: scenario name.
         :raises ValueError: if combination plan - scenario already exists
         """
-
-        if plan_name in self.existing.plan.tolist():
-            scenario = self.existing[self.existing.plan == plan_name]
-            if scenario_name in scenario.name.tolist():
-                raise ValueError(
-                    "Combination %s - %s already exists" % (plan_name, scenario_name)
-                )
+        if (plan_name, scenario_name) in self._existing_names:
+            raise ValueError(
+                "Combination %s - %s already exists" % (plan_name, scenario_name)
+            )
         self.plan_name = plan_name
         self.scenario_name = scenario_name
+        self._dirty = True
 
     def set_time(self, start_date, end_date, interval):
         """Sets scenario start and end dates as well as the interval that will
@@ -299,27 +368,34 @@ class _Builder:
 
         start_ts = pd.Timestamp(start_date)
         end_ts = pd.Timestamp(end_date)
-        hours = (end_ts - start_ts) / np.timedelta64(1, "h") + 1
+        hours, remainder = divmod(end_ts - start_ts, pd.Timedelta(hours=1))
+        hours += 1
         if start_ts > end_ts:
             raise ValueError("start_date > end_date")
         elif start_ts < min_ts or start_ts >= max_ts:
             raise ValueError("start_date not in [%s,%s[" % (min_ts, max_ts))
         elif end_ts <= min_ts or end_ts > max_ts:
             raise ValueError("end_date not in ]%s,%s]" % (min_ts, max_ts))
-        elif hours % int(interval.split("H", 1)[0]) != 0:
+        elif remainder or hours % int(interval.rstrip("H")) != 0:
             raise ValueError("Incorrect interval for start and end dates")
         else:
             self.start_date = start_date
             self.end_date = end_date
             self.interval = interval
+            self._dirty = True
 
     def get_base_profile(self, kind):
-        """Returns available base profiles.
+        """Returns available base profiles. Versions are only looked up once per
+        kind for the lifetime of the builder.
 
         :param str kind: one of *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
         :return: (*list*) -- available version for selected profile kind.
         """
-        return InputData().get_profile_version(self.grid_model, kind)
+        if kind not in self._profile_versions:
+            self._profile_versions[kind] = InputData().get_profile_version(
+                self.grid_model, kind
+            )
+        return self._profile_versions[kind]
 
     def set_base_profile(self, kind, version):
         """Sets demand profile.
@@ -340,6 +416,7 @@ class _Builder:
                 self.solar = version
             if kind == "wind":
                 self.wind = version
+            self._dirty = True
         else:
             raise ValueError("Available %s profiles: %s" % (kind, " | ".join(possible)))
 
@@ -354,6 +431,7 @@ class _Builder:
             return
         else:
             self.engine = engine
+            self._dirty = True
 
     def load_change_table(self, filename):
         """Uploads change table.
@@ -362,10 +440,12 @@ class _Builder:
         :raises FileNotFoundError: if file not found.
         """
         try:
-            ct = pickle.load(open(filename, "rb"))
-            self.change_table.ct = ct
-        except FileNotFoundError:
-            raise ("%s not found. " % filename)
+            with open(filename, "rb") as f:
+                ct = pickle.load(f)
+        except FileNotFoundError as e:
+            raise FileNotFoundError("%s not found" % filename) from e
+        self.change_table.ct = ct
+        self._dirty = True
 
     def get_grid(self):
         """Returns a transformed grid.
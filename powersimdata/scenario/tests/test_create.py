@@ -1,5 +1,12 @@
+import gc
+import pickle
+from types import SimpleNamespace
+
+import pandas as pd
 import pytest
 
+from powersimdata.scenario import create
+from powersimdata.scenario.create import _Builder, _get_scenario_table
 from powersimdata.scenario.scenario import Scenario
 
 
@@ -10,3 +17,137 @@ def test_get_bus_demand():
     scenario.state.set_grid(interconnect="Texas")
     scenario.state.builder.set_base_profile("demand", "vJan2021")
     scenario.state.get_bus_demand()
+
+
+class _DataAccess:
+    pass
+
+
+class _ScenarioListManager:
+    def __init__(self):
+        self.data_access = _DataAccess()
+        self.calls = 0
+
+    def get_scenario_table(self):
+        self.calls += 1
+        return pd.DataFrame()
+
+
+def test_scenario_table_is_reused(monkeypatch):
+    manager = _ScenarioListManager()
+    table = _get_scenario_table(manager)
+    assert _get_scenario_table(manager) is table
+    assert manager.calls == 1
+
+    assert _get_scenario_table(manager, refresh=True) is not table
+    assert manager.calls == 2
+
+    monkeypatch.setattr(create, "_scenario_table_ttl", 0)
+    _get_scenario_table(manager)
+    assert manager.calls == 3
+
+
+def test_scenario_table_is_dropped_with_data_access():
+    manager = _ScenarioListManager()
+    _get_scenario_table(manager)
+    key = id(manager.data_access)
+    assert key in create._scenario_tables
+    del manager
+    gc.collect()
+    assert key not in create._scenario_tables
+
+
+def test_set_time():
+    builder = SimpleNamespace()
+    _Builder.set_time(builder, "2016-01-01 00:00:00", "2016-01-31 23:00:00", "24H")
+    assert builder.interval == "24H"
+    with pytest.raises(ValueError, match="Incorrect interval"):
+        _Builder.set_time(builder, "2016-01-01 00:00:00", "2016-01-01 12:00:00", "24H")
+    with pytest.raises(ValueError, match="Incorrect interval"):
+        _Builder.set_time(builder, "2016-01-01 00:00:00", "2016-01-01 23:30:00", "24H")
+    with pytest.raises(ValueError, match="Incorrect interval"):
+        _Builder.set_time(builder, "2016-01-01 00:00:00", "2016-01-02 00:59:00", "1H")
+    with pytest.raises(ValueError, match="start_date > end_date"):
+        _Builder.set_time(builder, "2016-02-01 00:00:00", "2016-01-01 00:00:00", "1H")
+
+
+def test_load_change_table(tmp_path):
+    builder = SimpleNamespace(change_table=SimpleNamespace(ct={}))
+    filename = str(tmp_path / "ct.pkl")
+    with pytest.raises(FileNotFoundError, match="not found"):
+        _Builder.load_change_table(builder, filename)
+
+    with open(filename, "wb") as f:
+        pickle.dump({"demand": {"zone_id": {301: 1.1}}}, f)
+    _Builder.load_change_table(builder, filename)
+    assert builder.change_table.ct == {"demand": {"zone_id": {301: 1.1}}}
+
+
+def test_base_profile_versions_are_cached(monkeypatch):
+    calls = []
+
+    def get_profile_version(self, grid_model, kind):
+        calls.append(kind)
+        return ["vJan2021"]
+
+    monkeypatch.setattr(create.InputData, "get_profile_version", get_profile_version)
+    builder = SimpleNamespace(grid_model="usa_tamu", _profile_versions={})
+    for _ in range(2):
+        assert _Builder.get_base_profile(builder, "demand") == ["vJan2021"]
+        assert _Builder.get_base_profile(builder, "wind") == ["vJan2021"]
+    assert calls == ["demand", "wind"]
+
+
+def test_set_name():
+    builder = SimpleNamespace(_existing_names={("test", "dummy")})
+    _Builder.set_name(builder, "test", "other")
+    assert (builder.plan_name, builder.scenario_name) == ("test", "other")
+    with pytest.raises(ValueError, match="already exists"):
+        _Builder.set_name(builder, "test", "dummy")
+
+
+def test_update_scenario_info_only_copies_modified_builder():
+    builder = _Builder.__new__(_Builder)
+    for name in ("plan_name", "scenario_name", "demand", "hydro", "solar", "wind"):
+        setattr(builder, name, "")
+    builder.start_date = builder.end_date = builder.interval = builder.engine = ""
+    builder.change_table = SimpleNamespace(ct={})
+    builder._existing_names = set()
+    builder._dirty = True
+    state = SimpleNamespace(builder=builder, _scenario_info={})
+
+    create.Create._update_scenario_info(state)
+    assert not builder._dirty
+    assert state._scenario_info["change_table"] == "No"
+
+    state._scenario_info["plan"] = "stale"
+    builder.change_table.ct["demand"] = {}
+    create.Create._update_scenario_info(state)
+    assert state._scenario_info["plan"] == "stale"
+    assert state._scenario_info["change_table"] == "Yes"
+
+    builder.set_name("test", "dummy")
+    create.Create._update_scenario_info(state)
+    assert state._scenario_info["plan"] == "test"
+
+
+def test_failed_upload_does_not_add_execute_list_entry():
+    def upload():
+        raise IOError("upload failed")
+
+    info = {k: "x" for k in create._required_info}
+    execute_list = []
+    state = SimpleNamespace(
+        _update_scenario_info=lambda: None,
+        _scenario_info=info,
+        builder=SimpleNamespace(
+            get_grid=lambda: None, change_table=SimpleNamespace(ct={"demand": {}})
+        ),
+        _scenario_list_manager=SimpleNamespace(add_entry=lambda i: i.update(id="1")),
+        _data_access=object(),
+        _upload_change_table=upload,
+        _execute_list_manager=SimpleNamespace(add_entry=execute_list.append),
+    )
+    with pytest.raises(IOError, match="upload failed"):
+        create.Create.create_scenario(state)
+    assert execute_list == []
@@ -3,6 +3,26 @@ from contextlib import contextmanager
 from subprocess import PIPE, Popen
 
 
+class MockChannel:
+    def __init__(self, proc):
+        self.proc = proc
+
+    def recv_exit_status(self):
+        return self.proc.wait()
+
+
+class MockChannelFile:
+    def __init__(self, proc, stream):
+        self.channel = MockChannel(proc)
+        self.stream = stream
+
+    def read(self):
+        return self.stream.read()
+
+    def readlines(self):
+        return self.stream.readlines()
+
+
 class MockConnection:
     @contextmanager
     def open_sftp(self):
@@ -14,10 +34,27 @@ class MockConnection:
     def put(self, from_path, to_path):
         shutil.copy(from_path, to_path)
 
+    def putfo(self, fl, to_path):
+        with open(to_path, "wb") as f:
+            shutil.copyfileobj(fl, f)
+
     def exec_command(self, command):
         print(command)
-        proc = Popen(command, shell=True, stderr=PIPE)
-        return None, None, proc.stderr
+        proc = Popen(
+            command,
+            shell=True,
+            executable=shutil.which("bash"),
+            stdout=PIPE,
+            stderr=PIPE,
+            universal_newlines=True,
+        )
+        return None, MockChannelFile(proc, proc.stdout), proc.stderr
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return True
 
     def close(self):
         pass
@@ -1,5 +1,8 @@
 from math import acos, asin, cos, degrees, radians, sin, sqrt
 
+import numpy as np
+from scipy.spatial import cKDTree
+
 
 def haversine(point1, point2):
     """Given two lat/long pairs, return distance in miles.
@@ -58,6 +61,21 @@ def ll2uv(lon, lat):
     return uv
 
 
+def ll2uv_array(lon, lat):
+    """Convert arrays of (longitude, latitude) to unit vectors.
+
+    :param numpy.ndarray lon: longitudes of the sites (in deg.).
+    :param numpy.ndarray lat: latitudes of the sites (in deg.).
+    :return: (*numpy.ndarray*) -- array of 3-components (x,y,z) unit vectors, one
+        per row.
+    """
+    lon = np.radians(np.asarray(lon, dtype=float))
+    lat = np.radians(np.asarray(lat, dtype=float))
+    cos_lat = np.cos(lat)
+
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
 def angular_distance(uv1, uv2):
     """Calculate the angular distance between two vectors.
 
@@ -93,3 +111,37 @@ def find_closest_neighbor(point, neighbors):
             angle_min = angle
 
     return id_neighbor
+
+
+def build_neighbor_tree(neighbors):
+    """Builds a tree to locate closest neighbors with :func:`find_closest_neighbors`.
+
+    :param numpy.ndarray neighbors: each row is the (lon, lat) in degrees of a
+        potential neighbor.
+    :return: (*scipy.spatial.cKDTree*) -- tree of the unit vectors of the neighbors.
+    """
+    neighbors = np.asarray(neighbors, dtype=float).reshape(-1, 2)
+    return cKDTree(ll2uv_array(neighbors[:, 0], neighbors[:, 1]))
+
+
+def find_closest_neighbors(points, tree):
+    """Locates the closest neighbor of several points at once.
+
+    :param numpy.ndarray points: each row is the (lon, lat) in degrees of a point.
+    :param scipy.spatial.cKDTree tree: potential neighbors, as returned by
+        :func:`build_neighbor_tree`.
+    :return: (*numpy.ndarray*) -- id of the closest neighbor of each point. Ties are
+        resolved in favor of the neighbor listed first, as in
+        :func:`find_closest_neighbor`.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    uv_points = ll2uv_array(points[:, 0], points[:, 1])
+    # The chord between unit vectors grows with the angle between them
+    distance, _ = tree.query(uv_points)
+    return np.array(
+        [
+            min(tree.query_ball_point(uv, d + 1e-12))
+            for uv, d in zip(uv_points, distance)
+        ],
+        dtype=int,
+    )
@@ -2,6 +2,7 @@ import copy
 import importlib
 import os
 import sys
+from collections import OrderedDict
 
 
 class CommandBuilder:
@@ -39,11 +40,15 @@ class CommandBuilder:
 class MemoryCache:
     """Wrapper around a dict object that exposes a cache interface. Users should
     create a separate instance for each distinct use case.
+
+    :param int max_size: maximum number of cached objects. Once reached, the least
+        recently used object is evicted. The cache is unbounded if None.
     """
 
-    def __init__(self):
+    def __init__(self, max_size=None):
         """Constructor"""
-        self._cache = {}
+        self._cache = OrderedDict()
+        self.max_size = max_size
 
     def put(self, key, obj):
         """Add or set the value for the given key.
@@ -52,6 +57,9 @@ class MemoryCache:
         :param Any obj: the object to cache
         """
         self._cache[key] = copy.deepcopy(obj)
+        self._cache.move_to_end(key)
+        if self.max_size is not None and len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
 
     def get(self, key):
         """Retrieve the value associated with key if it exists.
@@ -59,7 +67,8 @@ class MemoryCache:
         :param tuple key: the cache key
         :return: (*Any* or *NoneType*) -- the cached value if found, or None
         """
-        if key in self._cache.keys():
+        if key in self._cache:
+            self._cache.move_to_end(key)
             return copy.deepcopy(self._cache[key])
 
     def list_keys(self):
@@ -1,8 +1,19 @@
 from math import sqrt
 
-from numpy.testing import assert_almost_equal, assert_array_almost_equal
+from numpy.testing import (
+    assert_almost_equal,
+    assert_array_almost_equal,
+    assert_array_equal,
+)
 
-from powersimdata.utility.distance import angular_distance, find_closest_neighbor, ll2uv
+from powersimdata.utility.distance import (
+    angular_distance,
+    build_neighbor_tree,
+    find_closest_neighbor,
+    find_closest_neighbors,
+    ll2uv,
+    ll2uv_array,
+)
 
 
 def test_ll2uv():
@@ -17,6 +28,14 @@ def test_ll2uv():
     assert_array_almost_equal(ll2uv(60, 60), [1 / 4, sqrt(3) / 4, sqrt(3) / 2])
 
 
+def test_ll2uv_array():
+    lon = [0, 45, -120, 60]
+    lat = [0, 90, -90, 60]
+    assert_array_almost_equal(
+        ll2uv_array(lon, lat), [ll2uv(x, y) for x, y in zip(lon, lat)]
+    )
+
+
 def test_angular_distance():
     # pole to pole
     assert_almost_equal(angular_distance([0.0, 0, 1.0], [0.0, 0, -1.0]), 180)
@@ -32,20 +51,29 @@ def test_angular_distance():
     )
 
 
+neighbors = [
+    [0, 45],
+    [10, 50],
+    [40, 40],
+    [-120, -60],
+    [44.75, 45.1],
+    [-270, 5],
+    [43, 46],
+    [320, 45],
+    [45, 44],
+    [44, 45],
+    [44.5, 45.5],
+]
+
+
 def test_find_closest_neighbor():
     point = (45, 45)
-    neighbors = [
-        [0, 45],
-        [10, 50],
-        [40, 40],
-        [-120, -60],
-        [44.75, 45.1],
-        [-270, 5],
-        [43, 46],
-        [320, 45],
-        [45, 44],
-        [44, 45],
-        [44.5, 45.5],
-    ]
     closest_neighbor_id = find_closest_neighbor(point, neighbors)
     assert closest_neighbor_id == 4
+
+
+def test_find_closest_neighbors():
+    tree = build_neighbor_tree(neighbors + [[44.75, 45.1]])
+    points = [(45, 45), (-120, -60), (0, 44), (320, 45)]
+    expected = [find_closest_neighbor(p, neighbors) for p in points]
+    assert_array_equal(find_closest_neighbors(points, tree), expected)
@@ -79,6 +79,17 @@ def test_mem_cache_put_version_never_changes():
     assert "key2" in obj
 
 
+def test_mem_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.put(cache_key("foo"), 1)
+    cache.put(cache_key("bar"), 2)
+    cache.get(cache_key("foo"))
+    cache.put(cache_key("baz"), 3)
+    assert cache.get(cache_key("bar")) is None
+    assert cache.get(cache_key("foo")) == 1
+    assert cache.get(cache_key("baz")) == 3
+
+
 def test_copy_command():
     expected = r"\cp -p source dest"
     command = CommandBuilder.copy("source", "dest")